@@ -118,17 +118,19 @@ def save_call_log(
     return {"success": False, "message": "Max retries exceeded"}
 
 # ─── fetch_call_logs ──────────────────────────────────────────────────────────
-def fetch_call_logs(limit: int = 100) -> list:
+def fetch_call_logs(limit: int = 100, columns: str = "*", before: str = None) -> list:
+    """Newest call logs first. List views pass `columns` so transcripts aren't shipped;
+    `before` (a created_at cursor) returns only older rows, for reading past PostgREST's
+    per-request row cap without rows shifting as new calls are inserted."""
     supabase = get_supabase()
     if not supabase:
         return []
     for attempt in range(_MAX_RETRIES):
         try:
-            res = (supabase.table("call_logs")
-                   .select("*")
-                   .order("created_at", desc=True)
-                   .limit(limit)
-                   .execute())
+            query = supabase.table("call_logs").select(columns)
+            if before:
+                query = query.lt("created_at", before)
+            res = query.order("created_at", desc=True).limit(limit).execute()
             return res.data or []
         except Exception as e:
             if _is_retryable(str(e)) and attempt < _MAX_RETRIES - 1:
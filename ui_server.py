@@ -1,14 +1,23 @@
 import json
 import logging
 import os
+import re
 import asyncio
-import uuid
+import functools
+import hashlib
+import secrets
+import struct
+import tempfile
+import threading
+import time
+import zlib
 import csv
 import io
 from datetime import datetime
 from typing import List, Optional
-from fastapi import FastAPI, Request, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, PlainTextResponse, JSONResponse, Response
+import pytz
+from fastapi import FastAPI, Request, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect, Query
+from fastapi.responses import HTMLResponse, PlainTextResponse, JSONResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -97,11 +106,47 @@ try:
 except ImportError:
     pass  # prometheus_client not installed — metrics endpoint skipped
 
+# ── Fast JSON for the data-heavy endpoints ───────────────────────────────────
+# Returning the response object directly also skips FastAPI's jsonable_encoder pass.
+try:
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+    import orjson  # noqa: F401 — ORJSONResponse needs it at render time
+except ImportError:
+    FastJSONResponse = JSONResponse  # orjson not installed — stdlib json
+
+def _json_with_etag(request: Request, payload) -> Response:
+    """JSON response tagged with a content hash; a matching If-None-Match gets an empty 304."""
+    resp = FastJSONResponse(payload)
+    etag = 'W/"' + hashlib.blake2b(resp.body, digest_size=8).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in (t.strip() for t in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+    resp.headers.update(headers)
+    return resp
+
 AGENTS_FILE = "agents.json"
 DEMO_FILE = "demo_links.json"
 
 # In-memory bulk campaign tracker
 bulk_campaigns: dict = {}
+_bulk_updates: dict = {}  # job_id -> asyncio.Condition, notified whenever that job changes
+BULK_CAMPAIGN_TTL = 3600  # seconds a finished campaign stays queryable
+BULK_STREAM_KEEPALIVE = 15  # seconds between SSE comments on an idle campaign stream
+
+def _prune_bulk_campaigns():
+    """Drop finished campaigns older than BULK_CAMPAIGN_TTL so the tracker doesn't grow forever."""
+    cutoff = time.time() - BULK_CAMPAIGN_TTL
+    for job_id, job in list(bulk_campaigns.items()):
+        if job.get("completed_at") and job["completed_at"] < cutoff:
+            bulk_campaigns.pop(job_id, None)
+            _bulk_updates.pop(job_id, None)
+
+async def _notify_bulk(job_id: str):
+    """Wake every /stream subscriber of a campaign after its state changed."""
+    cond = _bulk_updates.get(job_id)
+    if cond is not None:
+        async with cond:
+            cond.notify_all()
 
 def read_json_file(path, default):
     if os.path.exists(path):
@@ -114,6 +159,10 @@ def write_json_file(path, data):
         json.dump(data, f, indent=2)
 
 CONFIG_FILE = "config.json"
+# read_config/write_config run on worker threads (asyncio.to_thread): the lock serializes
+# read-merge-write, and writes go through a temp file + os.replace so readers never see
+# a partially written config.json
+_config_lock = threading.Lock()
 
 def read_config():
     config = {}
@@ -153,12 +202,19 @@ def read_config():
     }
 
 def write_config(data):
-    config = read_config()
     # Filter out null/None values so phantom fields never overwrite stored data
     filtered = {k: v for k, v in data.items() if v is not None}
-    config.update(filtered)
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=4)
+    with _config_lock:
+        config = read_config()
+        config.update(filtered)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(CONFIG_FILE)), prefix=".config-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(config, f, indent=4)
+            os.replace(tmp, CONFIG_FILE)
+        except BaseException:
+            os.unlink(tmp)
+            raise
     logger.info(f"[CONFIG] Updated keys: {list(filtered.keys())}")
 
 # ── Part C: Agent Helpers & Active Agent Route ──
@@ -222,14 +278,14 @@ async def api_put_active_agent(request: Request):
 
 @app.get("/api/config")
 async def api_get_config():
-    return read_config()
+    return await asyncio.to_thread(read_config)
 
 @app.post("/api/config")
 async def api_post_config(request: Request):
     data = await request.json()
-    write_config(data)
+    await asyncio.to_thread(write_config, data)
     logger.info("Configuration updated via UI.")
-    return read_config()
+    return await asyncio.to_thread(read_config)
 
 @app.post("/api/analyze-prompt")
 async def api_analyze_prompt(request: Request):
@@ -266,22 +322,71 @@ async def api_analyze_prompt(request: Request):
         "recommendation": recommendation,
     }
 
-@app.get("/api/logs")
-async def api_get_logs():
-    config = read_config()
+async def _ensure_supabase_env():
+    config = await asyncio.to_thread(read_config)
     # Prefer env vars (Coolify) over config.json
     if not os.environ.get("SUPABASE_URL"):
         os.environ["SUPABASE_URL"] = config.get("supabase_url", "")
     if not os.environ.get("SUPABASE_KEY"):
         os.environ["SUPABASE_KEY"] = config.get("supabase_key", "")
+
+def _call_status(summary) -> str:
+    """Classify a call summary once, server-side: booked | cancelled | completed | ended."""
+    if not summary:
+        return "ended"
+    s = summary.lower()
+    if "confirm" in s:
+        return "booked"
+    if "cancel" in s:
+        return "cancelled"
+    return "completed"
+
+DEFAULT_UI_TZ = "Asia/Kolkata"
+
+def _created_at_label(created_at, tz) -> str:
+    """Format a Supabase ISO timestamp for display in the browser's timezone."""
+    if not created_at:
+        return "—"
+    try:
+        dt = datetime.fromisoformat(created_at)
+    except (TypeError, ValueError):
+        return str(created_at)
+    if dt.tzinfo is None:
+        dt = pytz.utc.localize(dt)
+    return dt.astimezone(tz).strftime("%d %b %Y, %I:%M:%S %p")
+
+def _decorate_logs(logs: list, tz_name: str = DEFAULT_UI_TZ) -> list:
+    """Add display fields (status, created_at_label, duration_label) once, server-side."""
+    try:
+        tz = pytz.timezone(tz_name)
+    except pytz.UnknownTimeZoneError:
+        tz = pytz.utc
+    for log in logs:
+        log["status"] = _call_status(log.get("summary"))
+        log["created_at_label"] = _created_at_label(log.get("created_at"), tz)
+        log["duration_label"] = f"{log.get('duration_seconds') or 0}s"
+    return logs
+
+LOGS_MAX_LIMIT = 1000  # upper bound for ?limit= on /api/logs (also PostgREST's default row cap)
+
+# Columns the log tables actually render; the transcript (by far the largest field)
+# is downloaded per call from /api/logs/{id}/transcript instead
+LOG_LIST_COLUMNS = "id, phone_number, duration_seconds, summary, recording_url, created_at"
+CONTACT_COLUMNS = "phone_number, caller_name, summary, created_at"
+
+@app.get("/api/logs")
+async def api_get_logs(limit: int = Query(500, ge=1, le=LOGS_MAX_LIMIT), tz: str = DEFAULT_UI_TZ):
+    await _ensure_supabase_env()
     import db
     try:
-        logs = db.fetch_call_logs(limit=50)
-        return logs
+        logs = await asyncio.to_thread(db.fetch_call_logs, limit, LOG_LIST_COLUMNS)
+        return FastJSONResponse(_decorate_logs(logs, tz))
     except Exception as e:
         logger.error(f"Error fetching logs: {e}")
         return []
 
+_TRANSCRIPT_CHUNK = 64 * 1024
+
 @app.get("/api/logs/{log_id}/transcript")
 async def api_get_transcript(log_id: str):
     import db
@@ -292,13 +397,22 @@ async def api_get_transcript(log_id: str):
         data = res.data[0] if res.data else {}
         if not data:
             return PlainTextResponse(content="Log not found", status_code=404)
-        text = f"Call Log — {data.get('created_at', '')}\n"
-        text += f"Phone: {data.get('phone', 'Unknown')}\n"
-        text += f"Duration: {data.get('duration', 0)}s\n"
-        text += f"Summary: {data.get('summary', '')}\n\n"
-        text += "--- TRANSCRIPT ---\n"
-        text += data.get("transcript", "No transcript available.")
-        return PlainTextResponse(content=text, media_type="text/plain",
+        header = (
+            f"Call Log — {data.get('created_at', '')}\n"
+            f"Phone: {data.get('phone', 'Unknown')}\n"
+            f"Duration: {data.get('duration', 0)}s\n"
+            f"Summary: {data.get('summary', '')}\n\n"
+            "--- TRANSCRIPT ---\n"
+        )
+        transcript = data.get("transcript") or "No transcript available."
+
+        # Stream the transcript in chunks instead of concatenating one big string
+        def body():
+            yield header.encode("utf-8")
+            for i in range(0, len(transcript), _TRANSCRIPT_CHUNK):
+                yield transcript[i:i + _TRANSCRIPT_CHUNK].encode("utf-8")
+
+        return StreamingResponse(body(), media_type="text/plain; charset=utf-8",
                                  headers={"Content-Disposition": f"attachment; filename=transcript_{log_id}.txt"})
     except Exception as e:
         return PlainTextResponse(content=f"Error: {e}", status_code=500)
@@ -307,50 +421,131 @@ async def api_get_transcript(log_id: str):
 async def api_get_bookings():
     import db
     try:
-        return db.fetch_bookings()
+        return FastJSONResponse(db.fetch_bookings())
     except Exception as e:
         logger.error(f"Error fetching bookings: {e}")
         return []
 
+_STAT_SUFFIXES = {"total_calls": "", "total_bookings": "", "avg_duration": "s", "booking_rate": "%"}
+
+def _with_stat_labels(stats: dict) -> dict:
+    """Add the display strings for the dashboard stat cards (e.g. avg_duration_label = "42.5s")."""
+    for key, suffix in _STAT_SUFFIXES.items():
+        v = stats.get(key)
+        stats[f"{key}_label"] = f"{v if v is not None else 0}{suffix}"
+    return stats
+
 @app.get("/api/stats")
 async def api_get_stats():
     import db
     try:
-        return db.fetch_stats()
+        return FastJSONResponse(_with_stat_labels(db.fetch_stats()))
     except Exception as e:
         logger.error(f"Error fetching stats: {e}")
-        return {"total_calls": 0, "total_bookings": 0, "avg_duration": 0, "booking_rate": 0}
+        return _with_stat_labels({"total_calls": 0, "total_bookings": 0, "avg_duration": 0, "booking_rate": 0})
 
-@app.get("/api/contacts")
-async def api_get_contacts():
-    """CRM endpoint — groups call_logs by phone number, deduplicates into contacts."""
+@app.get("/api/dashboard")
+async def api_get_dashboard(tz: str = DEFAULT_UI_TZ):
+    """Stats + recent calls for the dashboard landing page in a single round-trip."""
+    await _ensure_supabase_env()
     import db
+    stats, logs = await asyncio.gather(
+        asyncio.to_thread(db.fetch_stats),
+        asyncio.to_thread(db.fetch_call_logs, 20, LOG_LIST_COLUMNS),
+        return_exceptions=True,
+    )
+    if isinstance(stats, Exception):
+        logger.error(f"Error fetching stats: {stats}")
+        stats = None
+    else:
+        _with_stat_labels(stats)
+    if isinstance(logs, Exception):
+        logger.error(f"Error fetching logs: {logs}")
+        logs = None
+    else:
+        _decorate_logs(logs, tz)
+    return FastJSONResponse({"stats": stats, "recent_logs": logs})
+
+# ── CRM contacts ──
+# Grouping call_logs into contacts is done once per data version (the newest call's
+# created_at) and kept as a snapshot. Page 0 returns the snapshot's version and later
+# pages ask for it (?v=), so a call landing mid-scroll can't shift rows between pages.
+CONTACTS_LOG_WINDOW = 10000      # most recent calls grouped into contacts
+CONTACTS_FETCH_BATCH = 1000      # PostgREST's default max rows per request
+CONTACTS_RECHECK_SECONDS = 15    # how long a snapshot is served before checking for new calls
+_CONTACT_SNAPSHOTS_KEPT = 4      # older versions kept so in-progress scrolls can finish
+_contact_snapshots: dict = {}    # version -> ordered contact list (insertion-ordered, oldest first)
+_contacts_state = {"version": None, "checked_at": 0.0}
+_contacts_lock = asyncio.Lock()
+
+def _group_contacts(rows: list) -> list:
+    """Deduplicate call logs by phone number, newest contact first."""
+    contacts: dict = {}
+    for r in rows:
+        phone = r.get("phone") or r.get("phone_number") or "unknown"
+        if phone not in contacts:
+            contacts[phone] = {
+                "phone_number": phone,
+                "caller_name": r.get("caller_name") or "",
+                "total_calls": 0,
+                "last_seen": r.get("created_at") or "",
+                "is_booked": False,
+            }
+        c = contacts[phone]
+        c["total_calls"] += 1
+        if not c["caller_name"] and r.get("caller_name"):
+            c["caller_name"] = r["caller_name"]
+        if r.get("summary") and "Confirmed" in r.get("summary", ""):
+            c["is_booked"] = True
+    return sorted(contacts.values(), key=lambda x: x["last_seen"], reverse=True)
+
+def _fetch_contact_logs() -> list:
+    import db
+    rows = []
+    while len(rows) < CONTACTS_LOG_WINDOW:
+        cursor = rows[-1].get("created_at") if rows else None
+        if rows and not cursor:
+            break
+        batch = db.fetch_call_logs(CONTACTS_FETCH_BATCH, CONTACT_COLUMNS, before=cursor)
+        rows.extend(batch)
+        if len(batch) < CONTACTS_FETCH_BATCH:
+            break
+    return rows
+
+async def _current_contacts() -> str:
+    """Version of the up-to-date contact snapshot, rebuilding it only when a new call exists."""
+    import db
+    async with _contacts_lock:
+        state = _contacts_state
+        if state["version"] and time.time() - state["checked_at"] < CONTACTS_RECHECK_SECONDS:
+            return state["version"]
+        newest = await asyncio.to_thread(db.fetch_call_logs, 1, "created_at")
+        version = hashlib.blake2b(str(newest[0]["created_at"] if newest else "").encode(),
+                                  digest_size=8).hexdigest()
+        if version not in _contact_snapshots:
+            _contact_snapshots[version] = _group_contacts(await asyncio.to_thread(_fetch_contact_logs))
+            while len(_contact_snapshots) > _CONTACT_SNAPSHOTS_KEPT:
+                _contact_snapshots.pop(next(iter(_contact_snapshots)))
+        state["version"], state["checked_at"] = version, time.time()
+        return version
+
+@app.get("/api/contacts")
+async def api_get_contacts(request: Request, limit: int = 100, offset: int = 0, v: str = ""):
+    """CRM endpoint — groups call_logs by phone number, deduplicates into contacts.
+
+    Returns one page: {"rows": [...], "total": <contact count>, "version": <snapshot>}.
+    Pass the version from page 0 as ``v`` for later pages; if that snapshot has been
+    dropped the current one is used and its (different) version tells the client.
+    """
     try:
-        rows = db.fetch_call_logs(limit=500)
-
-        # Deduplicate by phone number
-        contacts: dict = {}
-        for r in rows:
-            phone = r.get("phone") or r.get("phone_number") or "unknown"
-            if phone not in contacts:
-                contacts[phone] = {
-                    "phone_number": phone,
-                    "caller_name": r.get("caller_name") or "",
-                    "total_calls": 0,
-                    "last_seen": str(r.get("created_at", "")),
-                    "is_booked": False,
-                }
-            c = contacts[phone]
-            c["total_calls"] += 1
-            if not c["caller_name"] and r.get("caller_name"):
-                c["caller_name"] = r["caller_name"]
-            if r.get("summary") and "Confirmed" in r.get("summary", ""):
-                c["is_booked"] = True
-
-        return sorted(contacts.values(), key=lambda x: x["last_seen"] or "", reverse=True)
+        version = v if v in _contact_snapshots else await _current_contacts()
+        ordered = _contact_snapshots[version]
+        offset = max(offset, 0)
+        return _json_with_etag(request, {"rows": ordered[offset:offset + max(limit, 0)],
+                                         "total": len(ordered), "version": version})
     except Exception as e:
         logger.error(f"Error fetching contacts: {e}")
-        return []
+        return {"rows": [], "total": 0, "version": None}
 
 # ── Outbound Call Endpoints ───────────────────────────────────────────────────
 
@@ -365,7 +560,7 @@ async def api_outbound_call(request: Request):
         logger.warning(f"Blocked outbound call to {phone_number} (DNC)")
         raise HTTPException(403, "Number is on the Do-Not-Call list")
         
-    config = read_config()
+    config = await asyncio.to_thread(read_config)
     url = config.get("livekit_url") or os.getenv("LIVEKIT_URL", "")
     api_key = config.get("livekit_api_key") or os.getenv("LIVEKIT_API_KEY", "")
     api_secret = config.get("livekit_api_secret") or os.getenv("LIVEKIT_API_SECRET", "")
@@ -415,13 +610,17 @@ async def api_bulk_calls(request: Request):
     numbers = [n.strip() for n in data.get("numbers", []) if n.strip()]
     if not numbers:
         raise HTTPException(400, "No phone numbers provided")
-    job_id = str(uuid.uuid4())[:8]
+    _prune_bulk_campaigns()
+    job_id = secrets.token_urlsafe(6)
+    while job_id in bulk_campaigns:
+        job_id = secrets.token_urlsafe(6)
     bulk_campaigns[job_id] = {"status": "running", "total": len(numbers), "done": 0, "results": []}
+    _bulk_updates[job_id] = asyncio.Condition()
     asyncio.create_task(_run_bulk_campaign(job_id, numbers))
     return {"job_id": job_id, "total": len(numbers)}
 
 async def _run_bulk_campaign(job_id: str, numbers: list):
-    config = read_config()
+    config = await asyncio.to_thread(read_config)
     url = config.get("livekit_url") or os.getenv("LIVEKIT_URL", "")
     api_key = config.get("livekit_api_key") or os.getenv("LIVEKIT_API_KEY", "")
     api_secret = config.get("livekit_api_secret") or os.getenv("LIVEKIT_API_SECRET", "")
@@ -441,6 +640,7 @@ async def _run_bulk_campaign(job_id: str, numbers: list):
             logger.warning(f"Skipping {phone} in bulk campaign (DNC)")
             bulk_campaigns[job_id]["results"].append({"phone": phone, "status": "skipped (DNC)"})
             bulk_campaigns[job_id]["done"] += 1
+            await _notify_bulk(job_id)
             continue
             
         result = {"phone": phone, "status": "pending"}
@@ -468,19 +668,63 @@ async def _run_bulk_campaign(job_id: str, numbers: list):
             result["status"] = f"error: {e}"
         bulk_campaigns[job_id]["results"].append(result)
         bulk_campaigns[job_id]["done"] += 1
+        await _notify_bulk(job_id)
         await asyncio.sleep(3)
     bulk_campaigns[job_id]["status"] = "completed"
+    bulk_campaigns[job_id]["completed_at"] = time.time()
+    await _notify_bulk(job_id)
 
 @app.get("/api/call/bulk/{job_id}")
 async def api_bulk_status(job_id: str):
+    _prune_bulk_campaigns()
     if job_id not in bulk_campaigns:
         raise HTTPException(404, "Campaign not found")
     return bulk_campaigns[job_id]
 
+@app.get("/api/call/bulk/{job_id}/stream")
+async def api_bulk_stream(job_id: str, request: Request):
+    """Server-Sent Events for one campaign: an event per change carrying only the new results.
+
+    Each event has `offset` (index of its first result) so a reconnecting EventSource,
+    which starts over from offset 0, can skip rows it already has.
+    """
+    _prune_bulk_campaigns()
+    job = bulk_campaigns.get(job_id)
+    if job is None:
+        raise HTTPException(404, "Campaign not found")
+    cond = _bulk_updates[job_id]
+
+    async def events():
+        sent, last = 0, None
+        while True:
+            async with cond:
+                if (len(job["results"]), job["done"], job["status"]) == last:
+                    try:
+                        await asyncio.wait_for(cond.wait(), BULK_STREAM_KEEPALIVE)
+                    except asyncio.TimeoutError:
+                        pass
+            if await request.is_disconnected():
+                return
+            state = (len(job["results"]), job["done"], job["status"])
+            if state == last:
+                yield ": keepalive\n\n"
+                continue
+            last = state
+            update = {"status": job["status"], "total": job["total"], "done": job["done"],
+                      "offset": sent, "results": job["results"][sent:]}
+            sent = len(job["results"])
+            yield f"data: {json.dumps(update)}\n\n"
+            if job["status"] in ("completed", "stopped"):
+                return
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @app.post("/api/call/bulk/{job_id}/stop")
 async def api_bulk_stop(job_id: str):
     if job_id in bulk_campaigns:
         bulk_campaigns[job_id]["status"] = "stopped"
+        await _notify_bulk(job_id)
     return {"status": "stopped"}
 
 @app.post("/api/dnc")
@@ -722,15 +966,22 @@ async def api_campaign_stats(campaign_id: int):
 
 # ── Demo Link Endpoints (Supabase-backed) ───────────────────────────────────
 
-import secrets, string as _string
 from db import get_supabase
 
+# demo_links.slug is UNIQUE in Supabase; create retries on a collision instead of
+# tracking issued slugs in-process (that view is empty after a restart and per-worker).
+DEMO_SLUG_ATTEMPTS = 5
+
+def _is_unique_violation(e: Exception) -> bool:
+    return getattr(e, "code", None) == "23505" or "duplicate key" in str(e)
+
 @app.get("/api/demo/list")
-async def api_demo_list():
+async def api_demo_list(request: Request):
     try:
         sb = get_supabase()
         res = sb.table("demo_links").select("*").order("created_at", desc=True).execute()
-        return res.data or []
+        rows = res.data or []
+        return _json_with_etag(request, rows)
     except Exception as e:
         logger.error(f"[DEMO] list failed: {e}")
         return []
@@ -739,15 +990,21 @@ async def api_demo_list():
 async def api_demo_create(request: Request):
     body = await request.json()
     label = body.get("label") or body.get("name", "Demo Link")
-    slug = ''.join(secrets.choice(_string.ascii_lowercase + _string.digits) for _ in range(8))
     language = body.get("language", "auto")
     try:
         sb = get_supabase()
-        res = sb.table("demo_links").insert({
-            "slug": slug,
-            "label": label,
-            "language": language
-        }).execute()
+        for attempt in range(DEMO_SLUG_ATTEMPTS):
+            try:
+                res = sb.table("demo_links").insert({
+                    "slug": secrets.token_urlsafe(6),
+                    "label": label,
+                    "language": language
+                }).execute()
+                break
+            except Exception as e:
+                if not _is_unique_violation(e) or attempt == DEMO_SLUG_ATTEMPTS - 1:
+                    raise
+                logger.warning("[DEMO] slug collision, retrying")
         
         row = res.data[0] if res.data else None
         if not row:
@@ -832,26 +1089,9 @@ async def api_demo_delete(slug: str):
         logger.error(f"[DEMO] delete failed: {e}")
         raise HTTPException(500, str(e))
 
-@app.get("/demo/{slug}", response_class=HTMLResponse)
-async def demo_page(slug: str):
-    """Serve the visitor-facing browser demo page."""
-    try:
-        sb = get_supabase()
-        res = sb.table("demo_links").select("label, is_active").eq("slug", slug).execute()
-        row = res.data[0] if res.data else None
-    except Exception:
-        row = None
-
-    if not row or not row.get("is_active"):
-        return HTMLResponse(
-            "<h2 style='font-family:sans-serif;text-align:center;margin-top:20vh'>"
-            "This demo link is invalid or has expired.</h2>",
-            status_code=404
-        )
-
-    label = (row.get("label") or "AI Voice Agent").replace('"', '&quot;').replace("'", "&#39;")
-
-    return HTMLResponse(f"""<!DOCTYPE html>
+# Visitor-facing demo page. Plain str (not an f-string) with {label}/{slug}
+# placeholders; literal braces are doubled for str.format_map.
+_DEMO_TPL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1094,21 +1334,48 @@ async def demo_page(slug: str):
         }}
     </script>
 </body>
-</html>""")
+</html>"""
+
+@functools.lru_cache(maxsize=256)
+def _render_demo_page(slug: str, label: str) -> bytes:
+    return _DEMO_TPL.format_map({"slug": slug, "label": label}).encode("utf-8")
+
+@app.get("/demo/{slug}", response_class=HTMLResponse)
+async def demo_page(slug: str):
+    """Serve the visitor-facing browser demo page."""
+    def lookup():
+        sb = get_supabase()
+        return sb.table("demo_links").select("label, is_active").eq("slug", slug).execute()
+    try:
+        res = await asyncio.to_thread(lookup)
+        row = res.data[0] if res.data else None
+    except Exception:
+        row = None
+
+    if not row or not row.get("is_active"):
+        return HTMLResponse(
+            "<h2 style='font-family:sans-serif;text-align:center;margin-top:20vh'>"
+            "This demo link is invalid or has expired.</h2>",
+            status_code=404
+        )
+
+    label = (row.get("label") or "AI Voice Agent").replace('"', '&quot;').replace("'", "&#39;")
+
+    return HTMLResponse(content=_render_demo_page(slug, label))
 
 import db
 
 # ── Agent Management Endpoints ─────────────────────────────────────────────────
 
 @app.get("/api/agents")
-def api_get_agents():
+def api_get_agents(request: Request):
     import db
     try:
         agents = db.list_agents()
         # Ensure we return clean dicts for frontend rendering mapping 'active' states
         for a in agents:
             a['active'] = bool(a.get('is_inbound_active') or a.get('is_outbound_active'))
-        return agents
+        return _json_with_etag(request, agents)
     except Exception as e:
         logger.error(f"[API] /api/agents GET error: {e}")
         return []
@@ -1174,9 +1441,264 @@ def api_activate_outbound(agent_id: str):
 
 # ── Main Dashboard HTML ────────────────────────────────────────────────────────
 
+# (value, label) pairs for each config-backed <select> on the dashboard
+TTS_VOICE_OPTIONS = (
+    ("kavya", "Kavya — Female, Friendly"),
+    ("rohan", "Rohan — Male, Balanced"),
+    ("priya", "Priya — Female, Warm"),
+    ("shubh", "Shubh — Male, Formal"),
+    ("shreya", "Shreya — Female, Clear"),
+    ("ritu", "Ritu — Female, Soft"),
+    ("rahul", "Rahul — Male, Deep"),
+    ("amit", "Amit — Male, Casual"),
+    ("neha", "Neha — Female, Energetic"),
+    ("dev", "Dev — Male, Professional"),
+)
+TTS_LANG_OPTIONS = (
+    ("hi-IN", "Hindi (hi-IN)"),
+    ("en-IN", "English India (en-IN)"),
+    ("ta-IN", "Tamil (ta-IN)"),
+    ("te-IN", "Telugu (te-IN)"),
+    ("kn-IN", "Kannada (kn-IN)"),
+    ("ml-IN", "Malayalam (ml-IN)"),
+    ("mr-IN", "Marathi (mr-IN)"),
+    ("gu-IN", "Gujarati (gu-IN)"),
+    ("bn-IN", "Bengali (bn-IN)"),
+)
+LLM_OPTIONS = (
+    ("gpt-4o-mini", "gpt-4o-mini — Fast &amp; Cheap (Default)"),
+    ("gpt-4o", "gpt-4o — Balanced"),
+    ("gpt-4.1", "gpt-4.1 — Latest (Recommended)"),
+    ("gpt-4.1-mini", "gpt-4.1-mini — Fast &amp; Latest"),
+    ("gpt-4.5-preview", "gpt-4.5-preview — Most Capable"),
+    ("o4-mini", "o4-mini — Reasoning, Fast"),
+    ("o3", "o3 — Reasoning, Best"),
+    ("gpt-4-turbo", "gpt-4-turbo — Legacy"),
+    ("gpt-3.5-turbo", "gpt-3.5-turbo — Cheapest"),
+)
+_SELECT_OPTIONS = {
+    "tts_voice":    TTS_VOICE_OPTIONS,
+    "tts_language": TTS_LANG_OPTIONS,
+    "llm_model":    LLM_OPTIONS,
+}
+
+# Option tables for the Agent / Demo modal selects. These never depend on config,
+# so their markup is folded into the template once at import (see _DASHBOARD_STATIC).
+AGENT_TTS_LANG_OPTIONS = (
+    ("hi-IN", "Hindi (hi-IN)"),
+    ("en-IN", "English India (en-IN)"),
+    ("ta-IN", "Tamil (ta-IN)"),
+    ("te-IN", "Telugu (te-IN)"),
+    ("kn-IN", "Kannada (kn-IN)"),
+    ("gu-IN", "Gujarati (gu-IN)"),
+    ("bn-IN", "Bengali (bn-IN)"),
+    ("mr-IN", "Marathi (mr-IN)"),
+    ("ml-IN", "Malayalam (ml-IN)"),
+)
+AGENT_VOICE_OPTIONS = (
+    ("rohan", "Rohan — Male"),
+    ("kavya", "Kavya — Female"),
+    ("priya", "Priya — Female"),
+    ("dev", "Dev — Male"),
+    ("shreya", "Shreya — Female"),
+    ("neha", "Neha — Female"),
+    ("ritu", "Ritu — Female"),
+    ("amit", "Amit — Male"),
+    ("ananya", "Ananya — Female"),
+    ("roopa", "Roopa — Female"),
+    ("pavithra", "Pavithra — Female"),
+)
+AGENT_LLM_OPTIONS = (
+    ("gpt-4.1-mini", "gpt-4.1-mini (Latest Fast)"),
+    ("gpt-4o-mini", "gpt-4o-mini"),
+    ("gpt-4o", "gpt-4o (Balanced)"),
+    ("gpt-4-turbo", "gpt-4-turbo"),
+)
+DEMO_LANG_OPTIONS = (
+    ("auto", "Auto-detect 🌐 (recommended)"),
+    ("hi-IN", "Hindi"),
+    ("en-IN", "English"),
+    ("ta-IN", "Tamil"),
+    ("te-IN", "Telugu"),
+    ("bn-IN", "Bengali"),
+    ("gu-IN", "Gujarati"),
+    ("kn-IN", "Kannada"),
+    ("ml-IN", "Malayalam"),
+    ("mr-IN", "Marathi"),
+    ("pa-IN", "Punjabi"),
+    ("od-IN", "Odia"),
+    ("ur-IN", "Urdu (Hindi TTS)"),
+)
+
+# Quick-apply language presets for the Agent Settings page. The page fetches them from
+# /api/presets at a URL carrying their hash (presets_url), so they are cached for good.
+LANGUAGE_PRESETS = {
+    "hindi": {"stt": "hi-IN", "tts": "hi-IN", "voice": "rohan", "label": "Hindi",
+             "greeting": "Namaste! Daisy's Med Spa mein aapka swagat hai. Main aapki kaise madad kar sakti hoon?"},
+    "english": {"stt": "en-IN", "tts": "en-IN", "voice": "dev", "label": "English",
+               "greeting": "Hello! Welcome to Daisy's Med Spa. How can I help you today?"},
+    "tamil": {"stt": "ta-IN", "tts": "ta-IN", "voice": "kavya", "label": "Tamil",
+             "greeting": "Vanakkam! Daisy's Med Spa-vil ungalai varkarpom. Naan ungalukku eppadi udavalam?"},
+    "telugu": {"stt": "te-IN", "tts": "te-IN", "voice": "shreya", "label": "Telugu",
+              "greeting": "Namaskaram! Daisy's Med Spa ki swaagatam. Meeru ela help kavalaano?"},
+    "kannada": {"stt": "kn-IN", "tts": "kn-IN", "voice": "neha", "label": "Kannada",
+               "greeting": "Namaskara! Daisy's Med Spa ge swaagatha. Naanu nimage hege sahaya maadali?"},
+    "gujarati": {"stt": "gu-IN", "tts": "gu-IN", "voice": "priya", "label": "Gujarati",
+                "greeting": "Namaste! Daisy's Med Spa ma apnu swagat che. Hu tamne kevi rite madad kari shakun?"},
+    "bengali": {"stt": "bn-IN", "tts": "bn-IN", "voice": "ritu", "label": "Bengali",
+               "greeting": "Namaskar! Daisy's Med Spa-te apnake swagat. Ami apnake kemon sahajata korte pari?"},
+    "marathi": {"stt": "mr-IN", "tts": "mr-IN", "voice": "kavya", "label": "Marathi",
+               "greeting": "Namaskar! Daisy's Med Spa madhe aapale swagat aahe. Mi tumhala kashi madad karu shkto?"},
+    "malayalam": {"stt": "ml-IN", "tts": "ml-IN", "voice": "priya", "label": "Malayalam",
+                 "greeting": "Namaskaram! Daisy's Med Spa-il swagatham. Ente sahayam enthu?"},
+    "hinglish": {"stt": "hi-IN", "tts": "hi-IN", "voice": "rohan", "label": "Hinglish",
+                "greeting": "Namaste! Welcome to Daisy's Med Spa. Main aapki kaise help kar sakti hoon?"},
+    "multilingual": {"stt": "hi-IN", "tts": "hi-IN", "voice": "rohan", "label": "Multilingual",
+                    "greeting": "Namaste! Welcome to Daisy's Med Spa. Please speak any language — Hindi, English, Tamil, Telugu — and I'll respond in the same language."},
+}
+_PRESETS_BODY = json.dumps(LANGUAGE_PRESETS, ensure_ascii=False).encode("utf-8")
+_PRESETS_VERSION = hashlib.blake2b(_PRESETS_BODY, digest_size=8).hexdigest()
+
+@app.get("/api/presets")
+async def api_presets():
+    return Response(content=_PRESETS_BODY, media_type="application/json",
+                    headers={"Cache-Control": "public, max-age=86400, immutable",
+                             "ETag": f'"{_PRESETS_VERSION}"'})
+
+# Config keys sent to the page in its JSON bootstrap; each is the id of the field it fills
+_DASHBOARD_CONFIG_FIELDS = (
+    "first_line", "agent_instructions", "stt_min_endpointing_delay",
+    "livekit_url", "sip_trunk_id", "livekit_api_key", "livekit_api_secret",
+    "openai_api_key", "sarvam_api_key", "cal_api_key", "cal_event_type_id",
+    "telegram_bot_token", "telegram_chat_id", "supabase_url", "supabase_key",
+    "vobiz_sip_domain", "vobiz_username", "vobiz_password",
+    "vobiz_outbound_number", "vobiz_number_pool",
+)
+
+_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+_TEMPLATE_FIELD = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+def _compile_template(tpl: str, static: dict = None) -> list:
+    """Split a template with {{ field }} placeholders into (literal, field) pairs once, at import time.
+
+    Fields found in ``static`` are substituted here and merged into the surrounding
+    literal, so only the genuinely per-request fields remain.
+    """
+    static = static or {}
+    chunks = _TEMPLATE_FIELD.split(tpl)   # literal, field, literal, field, ..., literal
+    parts, pending = [], [chunks[0]]
+    for field, literal in zip(chunks[1::2], chunks[2::2]):
+        if field in static:
+            pending.append(static[field])
+        else:
+            parts.append(("".join(pending), field))
+            pending = []
+        pending.append(literal)
+    parts.append(("".join(pending), None))
+    return parts
+
+def _render_template(parts: list, values: dict) -> str:
+    out = []
+    for literal, field in parts:
+        out.append(literal)
+        if field is not None:
+            out.append(values[field])
+    return "".join(out)
+
+# ── Pre-compressed (gzip) rendering ──
+# Each chunk is deflated on its own and ends on a sync flush (byte-aligned, not final),
+# so chunks can be concatenated into a single valid stream. Static chunks are deflated
+# once at import; per request only the small dynamic values are compressed.
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+_DEFLATE_END = b"\x03\x00"   # empty final block
+
+def _deflate_chunk(data: bytes, level: int) -> bytes:
+    c = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return c.compress(data) + c.flush(zlib.Z_SYNC_FLUSH)
+
+def _compile_gzip(parts: list) -> list:
+    """Pre-deflate each static literal of a compiled template: [(raw, deflated, field)]."""
+    out = []
+    for literal, field in parts:
+        raw = literal.encode("utf-8")
+        out.append((raw, _deflate_chunk(raw, 9) if raw else b"", field))
+    return out
+
+def _render_gzip(parts: list, values: dict) -> bytes:
+    out = [_GZIP_HEADER]
+    crc = size = 0
+    for raw, deflated, field in parts:
+        out.append(deflated)
+        crc = zlib.crc32(raw, crc)
+        size += len(raw)
+        if field is not None:
+            val = values[field].encode("utf-8")
+            if val:
+                out.append(_deflate_chunk(val, 6))
+                crc = zlib.crc32(val, crc)
+                size += len(val)
+    out.append(_DEFLATE_END)
+    out.append(struct.pack("<II", crc, size & 0xFFFFFFFF))
+    return b"".join(out)
+
+def _options_html(options: tuple) -> str:
+    """Render a <select>'s <option> list (the first option is the default)."""
+    return "\n            ".join(f'<option value="{val}">{label}</option>' for val, label in options)
+
+# The dashboard page lives in templates/dashboard.html with {{ field }} placeholders.
+# It is read and split into static chunks once at import, so a request only joins
+# the few dynamic values.
+with open(os.path.join(_TEMPLATES_DIR, "dashboard.html"), encoding="utf-8") as _f:
+    _DASHBOARD_TPL = _f.read()
+_DASHBOARD_STATIC = {
+    "am_tts_lang_options": _options_html(AGENT_TTS_LANG_OPTIONS),
+    "am_voice_options":    _options_html(AGENT_VOICE_OPTIONS),
+    "am_llm_options":      _options_html(AGENT_LLM_OPTIONS),
+    "dm_language_options": _options_html(DEMO_LANG_OPTIONS),
+    "presets_url":         f"/api/presets?v={_PRESETS_VERSION}",
+    # Config-backed selects are static too; the bootstrap picks the selected option
+    **{f"{key}_options": _options_html(options) for key, options in _SELECT_OPTIONS.items()},
+}
+_DASHBOARD_PARTS = _compile_template(_DASHBOARD_TPL, _DASHBOARD_STATIC)
+_DASHBOARD_GZ_PARTS = _compile_gzip(_DASHBOARD_PARTS)
+# Folded into the ETag so a redeploy with a changed template never matches a stale cache.
+# Hashes the compiled parts, so changes to the Python-side static values count too.
+_DASHBOARD_TPL_HASH = hashlib.blake2b(
+    "\0".join(f"{literal}\0{field or ''}" for literal, field in _DASHBOARD_PARTS).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+# Brotli beats gzip by ~15-20% on this page but can't be stitched from pre-compressed
+# chunks, so the whole page is compressed once per distinct bootstrap and memoized.
+try:
+    import brotli
+except ImportError:
+    brotli = None  # brotli not installed — gzip only
+DASHBOARD_BROTLI_QUALITY = 9
+
+def _accepted_encodings(request: Request) -> set:
+    """Content codings named in Accept-Encoding (q-values ignored; q=0 is treated as refused)."""
+    out = set()
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            out.add(coding.strip().lower())
+    return out
+
+@functools.lru_cache(maxsize=16)
+def _dashboard_body(bootstrap: str, encoding: str) -> bytes:
+    """The encoded page for one bootstrap; repeat visits with unchanged config reuse it."""
+    values = {"bootstrap": bootstrap}
+    if encoding == "gzip":
+        return _render_gzip(_DASHBOARD_GZ_PARTS, values)
+    html = _render_template(_DASHBOARD_PARTS, values).encode("utf-8")
+    if encoding == "br":
+        return brotli.compress(html, quality=DASHBOARD_BROTLI_QUALITY)
+    return html
+
 @app.get("/", response_class=HTMLResponse)
-async def get_dashboard():
-    config = read_config()
+async def get_dashboard(request: Request):
+    config = await asyncio.to_thread(read_config)
 
     try:
         import db
@@ -1184,1880 +1706,31 @@ async def get_dashboard():
     except Exception:
         active = None
 
-    agent_name_display = (active or {}).get("name", "Voice Agent")
-    agent_subtitle_display = (active or {}).get("subtitle", "AI Assistant")
-
-    def sel(key, val):
-        return "selected" if config.get(key) == val else ""
-
-    # ── HTML-escape all user-supplied text to prevent JS SyntaxErrors ─────────
-    import html as _html
-    def e(v):
-        """HTML-escape a value so it's safe inside HTML attributes and textarea."""
-        return _html.escape(str(v or ""), quote=True)
-
-    _first_line       = e(config.get("first_line", ""))
-    _agent_instr      = e(config.get("agent_instructions", ""))
-    _livekit_url      = e(config.get("livekit_url", ""))
-    _sip_trunk_id     = e(config.get("sip_trunk_id", ""))
-    _livekit_api_key  = e(config.get("livekit_api_key", ""))
-    _livekit_api_sec  = e(config.get("livekit_api_secret", ""))
-    _openai_key       = e(config.get("openai_api_key", ""))
-    _sarvam_key       = e(config.get("sarvam_api_key", ""))
-    _cal_key          = e(config.get("cal_api_key", ""))
-    _cal_event        = e(config.get("cal_event_type_id", ""))
-    _tg_token         = e(config.get("telegram_bot_token", ""))
-    _tg_chat          = e(config.get("telegram_chat_id", ""))
-    _supa_url         = e(config.get("supabase_url", ""))
-    _supa_key         = e(config.get("supabase_key", ""))
-    _n8n_url          = e(config.get("n8n_webhook_url", ""))
-    _stt_delay        = e(config.get("stt_min_endpointing_delay", 0.6))
-    _opening_greeting = e(config.get("opening_greeting", ""))
-    _vobiz_sip_domain = e(config.get("vobiz_sip_domain", ""))
-    _vobiz_username   = e(config.get("vobiz_username", ""))
-    _vobiz_password   = e(config.get("vobiz_password", ""))
-    _vobiz_outbound_number = e(config.get("vobiz_outbound_number", ""))
-    _vobiz_pool       = e(config.get("vobiz_number_pool", ""))
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>AI Voice Agent — Dashboard</title>
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-  <style>
-    *, *::before, *::after {{ box-sizing: border-box; margin: 0; padding: 0; }}
-    :root {{
-      --bg: #0f1117;
-      --sidebar: #161b27;
-      --card: #1c2333;
-      --border: #2a3448;
-      --accent: #6c63ff;
-      --accent-glow: rgba(108,99,255,0.18);
-      --text: #e2e8f0;
-      --muted: #8892a4;
-      --green: #22c55e;
-      --red: #ef4444;
-      --yellow: #f59e0b;
-      --sidebar-w: 240px;
-    }}
-    body {{ font-family: 'Inter', sans-serif; background: var(--bg); color: var(--text); display: flex; height: 100vh; overflow: hidden; }}
-
-    /* ── Sidebar ── */
-    #sidebar {{
-      width: var(--sidebar-w); min-width: var(--sidebar-w);
-      background: var(--sidebar); border-right: 1px solid var(--border);
-      display: flex; flex-direction: column; padding: 24px 0;
-      position: relative; z-index: 10;
-    }}
-    .sidebar-brand {{
-      padding: 0 20px 24px;
-      border-bottom: 1px solid var(--border);
-      display: flex; align-items: center; gap: 10px;
-    }}
-    .sidebar-brand .logo {{
-      width: 32px; height: 32px; background: var(--accent);
-      border-radius: 8px; display: flex; align-items: center; justify-content: center;
-      font-size: 16px;
-    }}
-    .sidebar-brand .brand-text {{ font-weight: 700; font-size: 14px; line-height: 1.2; }}
-    .sidebar-brand .brand-sub {{ font-size: 10px; color: var(--muted); }}
-    .sidebar-nav {{ padding: 16px 0; flex: 1; }}
-    .nav-section {{ padding: 8px 16px 4px; font-size: 10px; font-weight: 600; color: var(--muted); text-transform: uppercase; letter-spacing: 0.08em; }}
-    .nav-item {{
-      display: flex; align-items: center; gap: 10px;
-      padding: 10px 20px; cursor: pointer; font-size: 13.5px; font-weight: 500;
-      color: var(--muted); border-left: 3px solid transparent;
-      transition: all 0.15s; user-select: none;
-    }}
-    .nav-item:hover {{ color: var(--text); background: rgba(255,255,255,0.04); }}
-    .nav-item.active {{ color: var(--accent); border-left-color: var(--accent); background: var(--accent-glow); }}
-    .nav-item .icon {{ font-size: 16px; width: 20px; text-align: center; }}
-    .sidebar-footer {{
-      padding: 16px 20px;
-      border-top: 1px solid var(--border);
-      font-size: 11px; color: var(--muted);
-    }}
-    .status-dot {{
-      display: inline-block; width: 7px; height: 7px; border-radius: 50%;
-      background: var(--green); margin-right: 6px; box-shadow: 0 0 6px var(--green);
-    }}
-
-    /* ── Main ── */
-    #main {{ flex: 1; overflow-y: auto; background: var(--bg); }}
-    .page {{ display: none; padding: 32px 36px; min-height: 100%; }}
-    .page.active {{ display: block; }}
-    .page-header {{ margin-bottom: 28px; }}
-    .page-title {{ font-size: 22px; font-weight: 700; }}
-    .page-sub {{ font-size: 13px; color: var(--muted); margin-top: 4px; }}
-
-    /* ── Cards ── */
-    .card {{
-      background: var(--card); border: 1px solid var(--border);
-      border-radius: 12px; padding: 20px;
-    }}
-    .stat-grid {{ display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; margin-bottom: 28px; }}
-    .stat-card {{ background: var(--card); border: 1px solid var(--border); border-radius: 12px; padding: 20px; }}
-    .stat-label {{ font-size: 11px; color: var(--muted); font-weight: 600; text-transform: uppercase; letter-spacing: 0.06em; }}
-    .stat-value {{ font-size: 28px; font-weight: 700; margin-top: 8px; }}
-    .stat-sub {{ font-size: 12px; color: var(--muted); margin-top: 4px; }}
-
-    /* ── Table ── */
-    .table-wrap {{ background: var(--card); border: 1px solid var(--border); border-radius: 12px; overflow: hidden; }}
-    table {{ width: 100%; border-collapse: collapse; font-size: 13px; }}
-    thead th {{ padding: 12px 16px; text-align: left; font-size: 11px; font-weight: 600; color: var(--muted); text-transform: uppercase; letter-spacing: 0.06em; background: rgba(255,255,255,0.03); border-bottom: 1px solid var(--border); }}
-    tbody td {{ padding: 13px 16px; border-bottom: 1px solid rgba(255,255,255,0.04); vertical-align: middle; }}
-    tbody tr:last-child td {{ border-bottom: none; }}
-    tbody tr:hover {{ background: rgba(255,255,255,0.025); }}
-    .badge {{ display: inline-flex; align-items: center; gap: 4px; padding: 3px 10px; border-radius: 20px; font-size: 11px; font-weight: 600; }}
-    .badge-green {{ background: rgba(34,197,94,0.12); color: var(--green); }}
-    .badge-gray {{ background: rgba(255,255,255,0.07); color: var(--muted); }}
-    .badge-yellow {{ background: rgba(245,158,11,0.12); color: var(--yellow); }}
-
-    /* ── Forms ── */
-    label {{ display: block; font-size: 12px; font-weight: 600; color: var(--muted); text-transform: uppercase; letter-spacing: 0.06em; margin-bottom: 6px; }}
-    input[type=text], input[type=password], input[type=number], select, textarea {{
-      width: 100%; background: var(--bg); border: 1px solid var(--border);
-      border-radius: 8px; padding: 10px 12px; color: var(--text); font-family: inherit;
-      font-size: 13.5px; outline: none; transition: border-color 0.15s;
-    }}
-    input:focus, select:focus, textarea:focus {{ border-color: var(--accent); box-shadow: 0 0 0 3px var(--accent-glow); }}
-    textarea {{ font-family: 'JetBrains Mono', 'Fira Code', monospace; resize: vertical; }}
-    .form-group {{ margin-bottom: 20px; }}
-    .form-row {{ display: grid; grid-template-columns: 1fr 1fr; gap: 16px; }}
-    .hint {{ font-size: 11.5px; color: var(--muted); margin-top: 5px; }}
-    .section-card {{ background: var(--card); border: 1px solid var(--border); border-radius: 12px; padding: 24px; margin-bottom: 20px; }}
-    .section-title {{ font-size: 14px; font-weight: 600; margin-bottom: 18px; padding-bottom: 12px; border-bottom: 1px solid var(--border); }}
-
-    /* ── Buttons ── */
-    .btn {{ display: inline-flex; align-items: center; gap: 6px; padding: 9px 18px; border-radius: 8px; font-size: 13px; font-weight: 600; cursor: pointer; border: none; transition: all 0.15s; }}
-    .btn-primary {{ background: var(--accent); color: #fff; }}
-    .btn-primary:hover {{ background: #5a52e0; box-shadow: 0 0 16px var(--accent-glow); }}
-    .btn-ghost {{ background: transparent; border: 1px solid var(--border); color: var(--muted); }}
-    .btn-ghost:hover {{ border-color: var(--accent); color: var(--accent); }}
-    .btn-sm {{ padding: 5px 12px; font-size: 12px; }}
-    .save-bar {{
-      position: sticky; bottom: 0; left: 0; right: 0;
-      background: rgba(22,27,39,0.95); backdrop-filter: blur(12px);
-      border-top: 1px solid var(--border);
-      padding: 14px 36px; display: flex; align-items: center; justify-content: space-between; z-index: 20;
-    }}
-    .save-status {{ font-size: 13px; font-weight: 500; color: var(--green); opacity: 0; transition: opacity 0.3s; }}
-
-    /* ── Calendar ── */
-    .cal-header {{ display: flex; align-items: center; justify-content: space-between; margin-bottom: 20px; }}
-    .cal-grid {{ display: grid; grid-template-columns: repeat(7, 1fr); gap: 6px; }}
-    .cal-day-name {{ text-align: center; font-size: 11px; color: var(--muted); font-weight: 600; padding: 8px 0; text-transform: uppercase; letter-spacing: 0.06em; }}
-    .cal-cell {{
-      min-height: 80px; background: var(--card); border: 1px solid var(--border);
-      border-radius: 10px; padding: 10px; cursor: pointer; transition: all 0.18s; position: relative;
-    }}
-    .cal-cell:hover {{ border-color: var(--accent); background: var(--accent-glow); transform: scale(1.03); box-shadow: 0 4px 20px rgba(108,99,255,0.15); }}
-    .cal-cell.today {{ border-color: var(--accent); box-shadow: 0 0 0 2px var(--accent-glow); }}
-    .cal-cell.other-month {{ opacity: 0.3; }}
-    .cal-num {{ font-size: 13px; font-weight: 700; }}
-    .cal-dot {{ width: 6px; height: 6px; border-radius: 50%; background: var(--accent); margin-top: 6px; box-shadow: 0 0 6px var(--accent); }}
-    .cal-booking-count {{ font-size: 10px; color: var(--accent); font-weight: 600; margin-top: 3px; }}
-    .day-panel {{ background: var(--card); border: 1px solid var(--border); border-radius: 12px; padding: 20px; margin-top: 20px; display: none; }}
-    .day-panel.show {{ display: block; animation: fadeIn 0.2s ease; }}
-    .booking-item {{ padding: 14px; background: var(--bg); border: 1px solid var(--border); border-radius: 10px; margin-bottom: 10px; transition: border-color 0.15s; }}
-    .booking-item:hover {{ border-color: var(--accent); }}
-    .booking-item:last-child {{ margin-bottom: 0; }}
-
-    /* ── Modal ── */
-    .modal-overlay {{
-      display: none; position: fixed; inset: 0;
-      background: rgba(0,0,0,0.7); backdrop-filter: blur(6px);
-      z-index: 1000; align-items: center; justify-content: center;
-    }}
-    .modal-overlay.open {{ display: flex; animation: fadeIn 0.2s ease; }}
-    .modal-box {{
-      background: var(--card); border: 1px solid var(--border);
-      border-radius: 16px; padding: 28px; min-width: 480px; max-width: 600px; width: 90%;
-      box-shadow: 0 24px 60px rgba(0,0,0,0.5);
-      animation: slideUp 0.25s ease;
-    }}
-    .modal-title {{ font-size: 18px; font-weight: 700; margin-bottom: 6px; }}
-    .modal-sub {{ font-size: 12px; color: var(--muted); margin-bottom: 20px; }}
-    .modal-close {{
-      position: absolute; top: 20px; right: 24px;
-      background: none; border: none; color: var(--muted);
-      font-size: 20px; cursor: pointer; line-height: 1;
-    }}
-    .modal-close:hover {{ color: var(--text); }}
-    @keyframes fadeIn {{ from {{ opacity:0 }} to {{ opacity:1 }} }}
-    @keyframes slideUp {{ from {{ transform:translateY(20px); opacity:0 }} to {{ transform:translateY(0); opacity:1 }} }}
-
-    /* ── Premium extras ── */
-    .stat-card {{ transition: transform 0.15s, box-shadow 0.15s; }}
-    .stat-card:hover {{ transform: translateY(-3px); box-shadow: 0 8px 30px rgba(108,99,255,0.12); }}
-    .stat-accent {{ color: var(--accent); }}
-    .pulse {{ animation: pulse 2s infinite; }}
-    @keyframes pulse {{ 0%,100% {{ box-shadow: 0 0 6px var(--green); }} 50% {{ box-shadow: 0 0 14px var(--green); }} }}
-    .preset-btn {{
-      background: transparent; border: 1px solid var(--border); color: var(--muted);
-      border-radius: 8px; padding: 8px 12px; font-size: 13px; font-weight: 600;
-      cursor: pointer; transition: all 0.15s; text-align: left;
-    }}
-    .preset-btn:hover {{ border-color: var(--accent); color: var(--accent); background: var(--accent-glow); }}
-    .agent-card {{
-      background: var(--card); border: 1px solid var(--border); border-radius: 12px; padding: 20px;
-      transition: border-color 0.15s;
-    }}
-    .agent-card.active {{ border-color: var(--green); box-shadow: 0 0 0 1px rgba(34,197,94,0.2); }}
-    .demo-card {{
-      background: var(--card); border: 1px solid var(--border); border-radius: 12px; padding: 20px;
-    }}
-  </style>
-</head>
-<body>
-
-<!-- ── Day Detail Modal ── -->
-<div class="modal-overlay" id="day-modal" onclick="if(event.target===this)closeDayModal()">
-  <div class="modal-box" style="position:relative;">
-    <button class="modal-close" onclick="closeDayModal()">✕</button>
-    <div class="modal-title" id="modal-date-title">Bookings</div>
-    <div class="modal-sub" id="modal-date-sub"></div>
-    <div id="modal-bookings-body"></div>
-  </div>
-</div>
-
-<!-- ── Agent Modal ── -->
-<div class="modal-overlay" id="agent-modal" onclick="if(event.target===this)closeAgentModal()">
-  <div class="modal-box" style="position:relative;max-width:660px;width:95%;max-height:92vh;overflow-y:auto;">
-    <button class="modal-close" onclick="closeAgentModal()">✕</button>
-    <div class="modal-title">🤖 Agent Configuration</div>
-    <div class="modal-sub">Create or edit an agent persona</div>
-
-    <div class="form-group"><label>Agent Name</label><input type="text" id="am-name" placeholder="e.g. Priya — Tamil Support"></div>
-
-    <!-- TTS Language + Voice -->
-    <div class="form-row">
-      <div class="form-group"><label>TTS Language</label>
-        <select id="am-tts-lang">
-          <option value="hi-IN">Hindi (hi-IN)</option>
-          <option value="en-IN">English India (en-IN)</option>
-          <option value="ta-IN">Tamil (ta-IN)</option>
-          <option value="te-IN">Telugu (te-IN)</option>
-          <option value="kn-IN">Kannada (kn-IN)</option>
-          <option value="gu-IN">Gujarati (gu-IN)</option>
-          <option value="bn-IN">Bengali (bn-IN)</option>
-          <option value="mr-IN">Marathi (mr-IN)</option>
-          <option value="ml-IN">Malayalam (ml-IN)</option>
-        </select>
-      </div>
-      <div class="form-group"><label>TTS Voice</label>
-        <select id="am-voice">
-          <option value="rohan">Rohan — Male</option>
-          <option value="kavya">Kavya — Female</option>
-          <option value="priya">Priya — Female</option>
-          <option value="dev">Dev — Male</option>
-          <option value="shreya">Shreya — Female</option>
-          <option value="neha">Neha — Female</option>
-          <option value="ritu">Ritu — Female</option>
-          <option value="amit">Amit — Male</option>
-          <option value="ananya">Ananya — Female</option>
-          <option value="roopa">Roopa — Female</option>
-          <option value="pavithra">Pavithra — Female</option>
-        </select>
-      </div>
-    </div>
-
-    <!-- STT Provider + Language -->
-    <div class="form-row">
-      <div class="form-group"><label>STT Provider (Transcriber)</label>
-        <select id="am-stt-provider">
-          <option value="sarvam">Sarvam AI (Indian langs)</option>
-          <option value="deepgram">Deepgram</option>
-          <option value="assemblyai">AssemblyAI</option>
-        </select>
-      </div>
-      <div class="form-group"><label>STT Language</label>
-        <select id="am-stt-lang">
-          <option value="unknown">Auto-detect 🌐</option>
-          <option value="hi-IN">Hindi</option>
-          <option value="en-IN">English India</option>
-          <option value="ta-IN">Tamil</option>
-          <option value="te-IN">Telugu</option>
-          <option value="kn-IN">Kannada</option>
-          <option value="ml-IN">Malayalam</option>
-          <option value="bn-IN">Bengali</option>
-          <option value="gu-IN">Gujarati</option>
-          <option value="mr-IN">Marathi</option>
-        </select>
-      </div>
-    </div>
-
-    <!-- LLM Provider + Model -->
-    <div class="form-row">
-      <div class="form-group"><label>LLM Provider</label>
-        <select id="am-llm-provider" onchange="onProviderChange()">
-          <option value="openai">OpenAI</option>
-          <option value="groq">Groq (Fast/Free)</option>
-          <option value="anthropic">Anthropic (Claude)</option>
-          <option value="openrouter">OpenRouter (Any model)</option>
-        </select>
-      </div>
-      <div class="form-group"><label>LLM Model</label>
-        <select id="am-llm">
-          <option value="gpt-4.1-mini">gpt-4.1-mini (Latest Fast)</option>
-          <option value="gpt-4o-mini">gpt-4o-mini</option>
-          <option value="gpt-4o">gpt-4o (Balanced)</option>
-          <option value="gpt-4-turbo">gpt-4-turbo</option>
-        </select>
-      </div>
-    </div>
-
-    <!-- Provider API Key (shown for non-OpenAI) -->
-    <div class="form-group" id="am-api-key-row" style="display:none">
-      <label id="am-api-key-label">Provider API Key</label>
-      <input type="password" id="am-api-key" placeholder="sk-...">
-      <small style="color:var(--muted);font-size:11px">Stored per-agent. Leave blank to use the global key in Credentials.</small>
-    </div>
-
-    <!-- Temperature + Max Tokens -->
-    <div class="form-row">
-      <div class="form-group">
-        <label>Temperature</label>
-        <input type="number" id="am-temperature" min="0" max="2" step="0.05" placeholder="0.3" value="0.3">
-        <small style="color:var(--muted);font-size:11px">0.0 = focused, 1.0 = creative</small>
-      </div>
-      <div class="form-group">
-        <label>Max Tokens</label>
-        <input type="number" id="am-max-tokens" min="50" max="2000" step="50" placeholder="400" value="400">
-        <small style="color:var(--muted);font-size:11px">Max reply length</small>
-      </div>
-    </div>
-
-    <!-- Endpointing + Max Turns -->
-    <div class="form-row">
-      <div class="form-group">
-        <label>Endpointing Delay (s)</label>
-        <input type="number" id="am-stt-delay" min="0.1" max="3.0" step="0.05" value="0.5">
-        <small style="color:var(--muted);font-size:11px">Pause before agent responds. 0.15 = snappy, 0.8 = patient</small>
-      </div>
-      <div class="form-group">
-        <label>Max Turns</label>
-        <input type="number" id="am-max-turns" min="5" max="100" step="1" value="25">
-        <small style="color:var(--muted);font-size:11px">Max back-and-forth exchanges per call</small>
-      </div>
-    </div>
-
-    <div class="form-group"><label>First Line (spoken on connect)</label><input type="text" id="am-first-line" placeholder="Namaste! Welcome to..."></div>
-    <div class="form-group">
-      <label>Opening Greeting (overrides First Line if set)</label>
-      <input type="text" id="am-opening-greeting" placeholder="Namaste! Welcome to...">
-    </div>
-    <div class="form-group">
-      <label>System Instructions (the agent's personality + rules)</label>
-      <textarea id="am-instructions" rows="7" placeholder="You are..."></textarea>
-      <!-- Prompt Analyzer badge — shown live as user types in instructions -->
-      <div id="prompt-analyzer-badge" style="margin-top:8px;padding:10px 14px;border-radius:10px;font-size:13px;background:rgba(255,255,255,0.04);border:1px solid rgba(255,255,255,0.08);display:none;">
-        <span id="pa-token-count" style="font-weight:700"></span>
-        <span id="pa-status-label" style="margin-left:8px;padding:2px 10px;border-radius:20px;font-size:11px;font-weight:700"></span>
-        <div id="pa-recommendation" style="margin-top:6px;color:var(--muted);font-size:12px"></div>
-      </div>
-    </div>
-    <div style="display:flex;gap:10px;justify-content:flex-end;margin-top:8px;">
-      <button class="btn btn-ghost" onclick="closeAgentModal()">Cancel</button>
-      <button class="btn btn-primary" onclick="saveAgent()">💾 Save Agent</button>
-    </div>
-  </div>
-</div>
-
-<!-- ── Demo Link Modal ── -->
-<div class="modal-overlay" id="demo-modal" onclick="if(event.target===this)closeDemoModal()">
-  <div class="modal-box" style="position:relative;">
-    <button class="modal-close" onclick="closeDemoModal()">✕</button>
-    <div class="modal-title">🔗 Create Demo Link</div>
-    <div class="modal-sub">Share a branded page so prospects can test your agent</div>
-    <div class="form-group"><label>Demo Name</label><input type="text" id="dm-name" placeholder="e.g. Tamil Demo — Daisy's Med Spa"></div>
-    <div class="form-group"><label>Phone Number (with country code)</label><input type="text" id="dm-phone" placeholder="+918849280319"></div>
-    <div class="form-group"><label>Language Label</label>
-      <select id="dm-language">
-        <option value="auto" selected>Auto-detect 🌐 (recommended)</option>
-        <option value="hi-IN">Hindi</option>
-        <option value="en-IN">English</option>
-        <option value="ta-IN">Tamil</option>
-        <option value="te-IN">Telugu</option>
-        <option value="bn-IN">Bengali</option>
-        <option value="gu-IN">Gujarati</option>
-        <option value="kn-IN">Kannada</option>
-        <option value="ml-IN">Malayalam</option>
-        <option value="mr-IN">Marathi</option>
-        <option value="pa-IN">Punjabi</option>
-        <option value="od-IN">Odia</option>
-        <option value="ur-IN">Urdu (Hindi TTS)</option>
-      </select>
-    </div>
-    <div class="form-group"><label>Greeting Preview (shown on demo page)</label><input type="text" id="dm-greeting" placeholder="Namaste! Welcome to Daisy's Med Spa..."></div>
-    <div style="display:flex;gap:10px;justify-content:flex-end;margin-top:8px;">
-      <button class="btn btn-ghost" onclick="closeDemoModal()">Cancel</button>
-      <button class="btn btn-primary" onclick="createDemo()">🔗 Create Link</button>
-    </div>
-  </div>
-</div>
-
-<!-- ── Sidebar ── -->
-<nav id="sidebar">
-  <div class="sidebar-brand">
-    <div class="logo">
-      <svg width="22" height="22" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
-        <circle cx="12" cy="12" r="10" fill="rgba(255,255,255,0.12)"/>
-        <path d="M8 12c0-2.21 1.79-4 4-4s4 1.79 4 4" stroke="white" stroke-width="1.8" stroke-linecap="round"/>
-        <circle cx="12" cy="15" r="2" fill="white"/>
-        <path d="M6 18c1.5-1.5 3.5-2.5 6-2.5s4.5 1 6 2.5" stroke="white" stroke-width="1.4" stroke-linecap="round" opacity="0.6"/>
-      </svg>
-    </div>
-    <div>
-      <div class="brand-text" id="sidebar-brand-name">{agent_name_display}</div>
-      <div class="brand-sub" id="sidebar-subtitle">{agent_subtitle_display}</div>
-    </div>
-  </div>
-  <div class="sidebar-nav">
-    <div class="nav-section">Overview</div>
-    <div class="nav-item active" onclick="goTo('dashboard', this)"><span class="icon">📊</span> Dashboard</div>
-    <div class="nav-item" onclick="goTo('calendar', this); loadCalendar();"><span class="icon">📅</span> Calendar</div>
-    <div class="nav-section" style="margin-top:12px;">Configuration</div>
-    <div class="nav-item" onclick="goTo('agent', this)"><span class="icon">🤖</span> Agent Settings</div>
-    <div class="nav-item" onclick="goTo('agents', this); loadAgents();"><span class="icon">🧠</span> Agents</div>
-    <div class="nav-item" onclick="goTo('models', this)"><span class="icon">🎙️</span> Models &amp; Voice</div>
-    <div class="nav-item" onclick="goTo('credentials', this)"><span class="icon">🔑</span> API Credentials</div>
-    <div class="nav-section" style="margin-top:12px;">Calling</div>
-    <div class="nav-item" onclick="goTo('outbound', this)"><span class="icon">📤</span> Outbound Calls</div>
-    <div class="nav-item" onclick="goTo('campaigns', this); loadCampaigns();"><span class="icon">📋</span> Campaigns</div>
-    <div class="nav-item" onclick="goTo('sip-trunks', this); loadSipTrunks();"><span class="icon">🔌</span> SIP Trunks</div>
-    <div class="nav-item" onclick="goTo('demos', this); loadDemos();"><span class="icon">🔗</span> Demo Links</div>
-    <div class="nav-section" style="margin-top:12px;">Data</div>
-    <div class="nav-item" onclick="goTo('logs', this); loadLogs();"><span class="icon">📞</span> Call Logs</div>
-    <div class="nav-item" onclick="goTo('crm', this); loadCRM();"><span class="icon">👥</span> CRM Contacts</div>
-  </div>
-  <div class="sidebar-footer">
-    <span class="status-dot pulse"></span>Agent Online
-  </div>
-</nav>
-
-<!-- ── Main Content ── -->
-<div id="main">
-
-  <!-- ── Dashboard ── -->
-  <div id="page-dashboard" class="page active">
-    <div class="page-header">
-      <div class="page-title">Dashboard</div>
-      <div class="page-sub">Real-time overview of your AI voice agent performance</div>
-    </div>
-    <div class="stat-grid" id="stat-grid">
-      <div class="stat-card"><div class="stat-label">Total Calls</div><div class="stat-value" id="stat-calls">—</div><div class="stat-sub">All time</div></div>
-      <div class="stat-card"><div class="stat-label">Bookings Made</div><div class="stat-value" id="stat-bookings">—</div><div class="stat-sub">Confirmed appointments</div></div>
-      <div class="stat-card"><div class="stat-label">Avg Duration</div><div class="stat-value" id="stat-duration">—</div><div class="stat-sub">Seconds per call</div></div>
-      <div class="stat-card"><div class="stat-label">Booking Rate</div><div class="stat-value" id="stat-rate">—</div><div class="stat-sub">Calls that converted</div></div>
-    </div>
-    <div class="section-card">
-      <div style="display:flex;align-items:center;justify-content:space-between;margin-bottom:16px;">
-        <div class="section-title" style="border:none;padding:0;margin:0;">Recent Calls</div>
-        <button class="btn btn-ghost btn-sm" onclick="loadDashboard()">↻ Refresh</button>
-      </div>
-      <div class="table-wrap">
-        <table>
-          <thead><tr><th>Date</th><th>Phone</th><th>Duration</th><th>Status</th><th>Actions</th></tr></thead>
-          <tbody id="dash-table-body"><tr><td colspan="5" style="text-align:center;padding:24px;color:var(--muted);">Loading...</td></tr></tbody>
-        </table>
-      </div>
-    </div>
-  </div>
-
-  <!-- ── Calendar ── -->
-  <div id="page-calendar" class="page">
-    <div class="page-header">
-      <div class="page-title">Booking Calendar</div>
-      <div class="page-sub">View confirmed appointments by date</div>
-    </div>
-    <div class="section-card">
-      <div class="cal-header">
-        <button class="btn btn-ghost btn-sm" onclick="changeMonth(-1)">← Prev</button>
-        <div style="font-size:16px;font-weight:700;" id="cal-month-label">Month Year</div>
-        <button class="btn btn-ghost btn-sm" onclick="changeMonth(1)">Next →</button>
-      </div>
-      <div class="cal-grid" id="cal-grid"></div>
-      <div class="day-panel" id="day-panel">
-        <div style="font-size:14px;font-weight:700;margin-bottom:12px;" id="day-panel-title">Selected Day</div>
-        <div id="day-panel-body"></div>
-      </div>
-    </div>
-  </div>
-
-  <!-- ── Agent Settings ── -->
-  <div id="page-agent" class="page">
-    <div class="page-header">
-      <div class="page-title">Agent Settings</div>
-      <div class="page-sub">Configure AI personality, opening line, and sensitivity</div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">Opening Greeting</div>
-      <div class="form-group">
-        <label>First Line (What the agent says when a call connects)</label>
-        <input type="text" id="first_line" value="{_first_line}" placeholder="Namaste! Welcome to Daisy's Med Spa...">
-        <div class="hint">This is the very first thing the agent says. Keep it concise and warm.</div>
-      </div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">System Prompt</div>
-      <div class="form-group">
-        <label>Master System Prompt</label>
-        <textarea id="agent_instructions" rows="16" placeholder="Enter the AI's full personality and instructions...">{_agent_instr}</textarea>
-        <div class="hint">Date and time context are injected automatically. Do not hardcode today's date.</div>
-      </div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">Listening Sensitivity</div>
-      <div class="form-group" style="max-width:220px;">
-        <label>Endpointing Delay (seconds)</label>
-        <input type="number" id="stt_min_endpointing_delay" step="0.05" min="0.1" max="3.0" value="{_stt_delay}">
-        <div class="hint">Seconds the AI waits after silence before responding. Default: 0.6</div>
-      </div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">Voice Synthesis (Sarvam bulbul:v3)</div>
-      <div class="form-row" style="max-width:720px;">
-        <div class="form-group">
-          <label>Speaker Voice</label>
-          <select id="tts_voice">
-            <option value="kavya" {sel('tts_voice','kavya')}>Kavya — Female, Friendly</option>
-            <option value="rohan" {sel('tts_voice','rohan')}>Rohan — Male, Balanced</option>
-            <option value="priya" {sel('tts_voice','priya')}>Priya — Female, Warm</option>
-            <option value="shubh" {sel('tts_voice','shubh')}>Shubh — Male, Formal</option>
-            <option value="shreya" {sel('tts_voice','shreya')}>Shreya — Female, Clear</option>
-            <option value="ritu" {sel('tts_voice','ritu')}>Ritu — Female, Soft</option>
-            <option value="rahul" {sel('tts_voice','rahul')}>Rahul — Male, Deep</option>
-            <option value="amit" {sel('tts_voice','amit')}>Amit — Male, Casual</option>
-            <option value="neha" {sel('tts_voice','neha')}>Neha — Female, Energetic</option>
-            <option value="dev" {sel('tts_voice','dev')}>Dev — Male, Professional</option>
-          </select>
-        </div>
-        <div class="form-group">
-          <label>Language</label>
-          <select id="tts_language">
-            <option value="hi-IN" {sel('tts_language','hi-IN')}>Hindi (hi-IN)</option>
-            <option value="en-IN" {sel('tts_language','en-IN')}>English India (en-IN)</option>
-            <option value="ta-IN" {sel('tts_language','ta-IN')}>Tamil (ta-IN)</option>
-            <option value="te-IN" {sel('tts_language','te-IN')}>Telugu (te-IN)</option>
-            <option value="kn-IN" {sel('tts_language','kn-IN')}>Kannada (kn-IN)</option>
-            <option value="ml-IN" {sel('tts_language','ml-IN')}>Malayalam (ml-IN)</option>
-            <option value="mr-IN" {sel('tts_language','mr-IN')}>Marathi (mr-IN)</option>
-            <option value="gu-IN" {sel('tts_language','gu-IN')}>Gujarati (gu-IN)</option>
-            <option value="bn-IN" {sel('tts_language','bn-IN')}>Bengali (bn-IN)</option>
-          </select>
-        </div>
-      </div>
-    </div>
-    <div class="save-bar">
-      <span class="save-status" id="save-status-agent">✅ Saved!</span>
-      <button class="btn btn-primary" onclick="saveConfig('agent')">💾 Save Agent Settings</button>
-    </div>
-  </div>
-
-  <!-- ── Models & Voice ── -->
-  <div id="page-models" class="page">
-    <div class="page-header">
-      <div class="page-title">Models & Voice</div>
-      <div class="page-sub">Select the LLM brain and TTS voice persona</div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">🌐 Language Presets <span style="font-size:11px;color:var(--muted);font-weight:400;">(click to auto-fill all language settings)</span></div>
-      <div style="display:grid;grid-template-columns:repeat(auto-fill,minmax(160px,1fr));gap:10px;margin-bottom:4px;">
-        <button class="preset-btn" onclick="applyPreset('hindi')">🇮🇳 Hindi</button>
-        <button class="preset-btn" onclick="applyPreset('english')">🇬🇧 English (India)</button>
-        <button class="preset-btn" onclick="applyPreset('tamil')">🌐 Tamil</button>
-        <button class="preset-btn" onclick="applyPreset('telugu')">🌐 Telugu</button>
-        <button class="preset-btn" onclick="applyPreset('kannada')">🌐 Kannada</button>
-        <button class="preset-btn" onclick="applyPreset('gujarati')">🌐 Gujarati</button>
-        <button class="preset-btn" onclick="applyPreset('bengali')">🌐 Bengali</button>
-        <button class="preset-btn" onclick="applyPreset('marathi')">🌐 Marathi</button>
-        <button class="preset-btn" onclick="applyPreset('malayalam')">🌐 Malayalam</button>
-        <button class="preset-btn" onclick="applyPreset('hinglish')" style="border-color:var(--accent);color:var(--accent);">🎯 Hinglish</button>
-        <button class="preset-btn" onclick="applyPreset('multilingual')" style="border-color:#f59e0b;color:#f59e0b;">🌍 Multilingual</button>
-      </div>
-      <div class="hint" id="preset-status"></div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">Language Model (LLM)</div>
-      <div class="form-group" style="max-width:360px;">
-        <label>OpenAI Model</label>
-        <select id="llm_model">
-          <option value="gpt-4o-mini" {sel('llm_model','gpt-4o-mini')}>gpt-4o-mini — Fast &amp; Cheap (Default)</option>
-          <option value="gpt-4o" {sel('llm_model','gpt-4o')}>gpt-4o — Balanced</option>
-          <option value="gpt-4.1" {sel('llm_model','gpt-4.1')}>gpt-4.1 — Latest (Recommended)</option>
-          <option value="gpt-4.1-mini" {sel('llm_model','gpt-4.1-mini')}>gpt-4.1-mini — Fast &amp; Latest</option>
-          <option value="gpt-4.5-preview" {sel('llm_model','gpt-4.5-preview')}>gpt-4.5-preview — Most Capable</option>
-          <option value="o4-mini" {sel('llm_model','o4-mini')}>o4-mini — Reasoning, Fast</option>
-          <option value="o3" {sel('llm_model','o3')}>o3 — Reasoning, Best</option>
-          <option value="gpt-4-turbo" {sel('llm_model','gpt-4-turbo')}>gpt-4-turbo — Legacy</option>
-          <option value="gpt-3.5-turbo" {sel('llm_model','gpt-3.5-turbo')}>gpt-3.5-turbo — Cheapest</option>
-        </select>
-      </div>
-    </div>
-    <!-- Voice Synthesis moved to Agent Settings -->
-    <div class="save-bar">
-      <span class="save-status" id="save-status-models">✅ Saved!</span>
-      <button class="btn btn-primary" onclick="saveConfig('models')">💾 Save Model Settings</button>
-    </div>
-  </div>
-
-  <!-- ── Agents Page ── -->
-  <div id="page-agents" class="page">
-    <div class="page-header">
-      <div style="display:flex;align-items:center;justify-content:space-between;">
-        <div>
-          <div class="page-title">🧠 Agent Library</div>
-          <div class="page-sub">Create and manage multiple agent personas. Activate one to make it live.</div>
-        </div>
-        <button class="btn btn-primary" onclick="openAgentModal()">＋ New Agent</button>
-      </div>
-    </div>
-    <div id="agents-grid" style="display:grid;grid-template-columns:repeat(auto-fill,minmax(320px,1fr));gap:16px;"></div>
-  </div>
-
-  <!-- ── Outbound Calls Page ── -->
-  <div id="page-outbound" class="page">
-    <div class="page-header">
-      <div class="page-title">📤 Outbound Calls</div>
-      <div class="page-sub">Dispatch AI calls to individual numbers or run bulk campaigns</div>
-    </div>
-    <div style="display:grid;grid-template-columns:1fr 1fr;gap:20px;align-items:start;">
-      <div class="section-card">
-        <div class="section-title">Single Call</div>
-        <div class="form-group">
-          <label>Phone Number (with country code)</label>
-          <input type="text" id="single-phone" placeholder="+918849280319">
-          <div class="hint">Must include + and country code</div>
-        </div>
-        <button class="btn btn-primary" style="width:100%" onclick="dispatchSingleCall()">📞 Dispatch Call</button>
-        <div id="single-call-status" style="margin-top:12px;font-size:13px;"></div>
-      </div>
-      <div class="section-card">
-        <div class="section-title">Bulk Campaign</div>
-        <div class="form-group">
-          <label>Phone Numbers (one per line)</label>
-          <textarea id="bulk-phones" rows="6" placeholder="+918849280319
-+917777777777
-+919999999999"></textarea>
-        </div>
-        <div style="display:flex;gap:10px;">
-          <button class="btn btn-primary" style="flex:1" onclick="startBulkCampaign()">▶ Start Campaign</button>
-          <button class="btn btn-ghost" onclick="stopBulkCampaign()">⏹ Stop</button>
-        </div>
-        <div id="bulk-progress" style="margin-top:14px;"></div>
-      </div>
-    </div>
-    <div class="section-card" style="margin-top:20px;" id="outbound-log-card">
-      <div class="section-title">Campaign Log</div>
-      <div id="outbound-log" style="font-size:13px;color:var(--muted);">No calls dispatched yet.</div>
-    </div>
-  </div>
-
-  <!-- ── Campaigns Page ── -->
-  <div id="page-campaigns" class="page">
-    <div class="page-header">
-      <div style="display:flex;align-items:center;justify-content:space-between;">
-        <div>
-          <div class="page-title">📋 Campaigns</div>
-          <div class="page-sub">Create outbound calling campaigns, upload leads, and track progress</div>
-        </div>
-        <button class="btn btn-primary" onclick="openCampaignModal()">＋ New Campaign</button>
-      </div>
-    </div>
-    <!-- Live Calls Panel -->
-    <div class="section-card" style="margin-bottom:16px;">
-      <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:12px;">
-        <div class="section-title" style="margin:0;">📞 Live Calls <span id="live-calls-badge" style="font-size:12px;background:rgba(108,99,255,0.15);color:var(--accent);padding:2px 8px;border-radius:20px;margin-left:6px;">0 active</span></div>
-        <div style="font-size:12px;color:var(--muted);" id="ws-status">⚪ Connecting...</div>
-      </div>
-      <div id="live-calls-table" style="font-size:13px;color:var(--muted);">No active calls right now.</div>
-    </div>
-    <div id="campaigns-list" style="display:grid;gap:12px;"></div>
-  </div>
-
-  <!-- ── SIP Trunks Page ── -->
-  <div id="page-sip-trunks" class="page">
-    <div class="page-header">
-      <div style="display:flex;align-items:center;justify-content:space-between;">
-        <div>
-          <div class="page-title">🔌 SIP Trunks</div>
-          <div class="page-sub">Configure SIP trunks for masked outbound calling</div>
-        </div>
-        <button class="btn btn-primary" onclick="openSipTrunkModal()">＋ Add SIP Trunk</button>
-      </div>
-    </div>
-    <div id="sip-trunks-list" style="display:grid;gap:12px;"></div>
-  </div>
-
-  <!-- ── SIP Trunk Modal ── -->
-  <div id="sip-modal-overlay" onclick="closeSipTrunkModal(event)" style="display:none;position:fixed;inset:0;background:rgba(0,0,0,0.7);z-index:1000;align-items:center;justify-content:center;">
-    <div style="background:var(--surface);border:1px solid rgba(108,99,255,0.3);border-radius:18px;padding:36px 32px;width:min(500px,94vw);max-height:90vh;overflow-y:auto;" onclick="event.stopPropagation()">
-      <div style="font-size:18px;font-weight:700;margin-bottom:24px;">🔌 Add SIP Trunk</div>
-      <div class="form-group">
-        <label>Trunk Name <span style="color:#f87171">*</span></label>
-        <input type="text" id="sip-name" placeholder="e.g. Vobiz Primary">
-      </div>
-      <div class="form-group">
-        <label>Provider <span style="color:#f87171">*</span></label>
-        <input type="text" id="sip-provider" placeholder="e.g. twilio, exotel, vobiz">
-      </div>
-      <div class="form-group">
-        <label>SIP URI <span style="color:#f87171">*</span></label>
-        <input type="text" id="sip-uri" placeholder="sip:user@sip.provider.com">
-      </div>
-      <div class="form-group">
-        <label>Masked Caller ID (E.164)</label>
-        <input type="text" id="sip-callerid" placeholder="+919876543210">
-        <div class="hint">Number shown to the callee — leave blank to use provider default</div>
-      </div>
-      <div style="display:grid;grid-template-columns:1fr 1fr;gap:12px;">
-        <div class="form-group">
-          <label>SIP Username</label>
-          <input type="text" id="sip-username" placeholder="Optional">
-        </div>
-        <div class="form-group">
-          <label>SIP Password</label>
-          <input type="password" id="sip-password" placeholder="Optional">
-        </div>
-      </div>
-      <div id="sip-modal-error" style="color:#f87171;font-size:13px;margin-bottom:12px;display:none;"></div>
-      <div style="display:flex;gap:10px;margin-top:8px;">
-        <button class="btn btn-primary" style="flex:1" onclick="submitSipTrunk()">Save Trunk</button>
-        <button class="btn btn-ghost" onclick="closeSipTrunkModal()" style="width:100px;">Cancel</button>
-      </div>
-    </div>
-  </div>
-
-  <!-- ── Campaign Modal ── -->
-  <div id="campaign-modal-overlay" onclick="closeCampaignModal(event)" style="display:none;position:fixed;inset:0;background:rgba(0,0,0,0.7);z-index:1000;align-items:center;justify-content:center;">
-    <div style="background:var(--surface);border:1px solid rgba(108,99,255,0.3);border-radius:18px;padding:36px 32px;width:min(560px,94vw);max-height:90vh;overflow-y:auto;" onclick="event.stopPropagation()">
-      <div style="font-size:18px;font-weight:700;margin-bottom:24px;">📋 New Campaign</div>
-      <div class="form-group">
-        <label>Campaign Name <span style="color:#f87171">*</span></label>
-        <input type="text" id="camp-name" placeholder="e.g. March Follow-up Campaign">
-      </div>
-      <div class="form-group">
-        <label>Agent</label>
-        <select id="camp-agent-id" style="width:100%;padding:10px 14px;background:var(--bg);border:1px solid var(--border);border-radius:10px;color:var(--text);font-size:14px;"><option value="">— No agent assigned —</option></select>
-        <div class="hint">Which agent will handle these calls</div>
-      </div>
-      <div class="form-group">
-        <label>SIP Trunk</label>
-        <select id="camp-trunk-id" style="width:100%;padding:10px 14px;background:var(--bg);border:1px solid var(--border);border-radius:10px;color:var(--text);font-size:14px;"><option value="">— Default trunk —</option></select>
-      </div>
-      <div style="display:grid;grid-template-columns:1fr 1fr 1fr;gap:12px;">
-        <div class="form-group">
-          <label>Max Concurrent</label>
-          <input type="number" id="camp-maxconc" value="5" min="1" max="50">
-        </div>
-        <div class="form-group">
-          <label>Calls / min</label>
-          <input type="number" id="camp-cpm" value="5" min="1" max="60">
-        </div>
-        <div class="form-group">
-          <label>Max Retries</label>
-          <input type="number" id="camp-maxretries" value="2" min="0" max="10">
-        </div>
-      </div>
-      <div class="form-group" style="display:flex;align-items:center;gap:10px;">
-        <input type="checkbox" id="camp-retry" style="width:auto;" checked>
-        <label style="font-size:13px;margin:0;">Retry failed calls</label>
-      </div>
-      <div class="form-group">
-        <label>Notes</label>
-        <input type="text" id="camp-notes" placeholder="Optional internal notes">
-      </div>
-      <div id="camp-modal-error" style="color:#f87171;font-size:13px;margin-bottom:12px;display:none;"></div>
-      <div style="display:flex;gap:10px;margin-top:8px;">
-        <button class="btn btn-primary" style="flex:1" onclick="submitCampaign()">Create Campaign</button>
-        <button class="btn btn-ghost" onclick="document.getElementById('campaign-modal-overlay').style.display='none'" style="width:100px;">Cancel</button>
-      </div>
-    </div>
-  </div>
-
-  <!-- ── Lead Upload Modal ── -->
-  <div id="leads-modal-overlay" onclick="if(event.target===this)closeLeadsModal()" style="display:none;position:fixed;inset:0;background:rgba(0,0,0,0.7);z-index:1000;align-items:center;justify-content:center;">
-    <div style="background:var(--surface);border:1px solid rgba(108,99,255,0.3);border-radius:18px;padding:36px 32px;width:min(500px,94vw);max-height:90vh;overflow-y:auto;" onclick="event.stopPropagation()">
-      <div style="font-size:18px;font-weight:700;margin-bottom:8px;">📁 Upload Leads</div>
-      <div style="font-size:13px;color:var(--muted);margin-bottom:20px;">CSV with <code>phone</code> column required. Optional: <code>name</code>, <code>email</code>. Extra columns go to custom_data.</div>
-      <input type="hidden" id="leads-upload-campaign-id">
-      <div class="form-group">
-        <label>CSV File <span style="color:#f87171">*</span></label>
-        <input type="file" id="leads-file" accept=".csv,.txt" style="width:100%;padding:10px 14px;background:var(--bg);border:1px solid var(--border);border-radius:10px;color:var(--text);font-size:14px;">
-      </div>
-      <div id="leads-upload-result" style="font-size:13px;margin-bottom:12px;display:none;"></div>
-      <div style="display:flex;gap:10px;margin-top:8px;">
-        <button class="btn btn-primary" style="flex:1" onclick="uploadLeads()">Upload</button>
-        <button class="btn btn-ghost" onclick="closeLeadsModal()" style="width:100px;">Close</button>
-      </div>
-    </div>
-  </div>
-
-  <!-- ── Demo Links Page ── -->
-  <div id="page-demos" class="page">
-    <div class="page-header">
-      <div style="display:flex;align-items:center;justify-content:space-between;">
-        <div>
-          <div class="page-title">🔗 Demo Links</div>
-          <div class="page-sub">Share branded landing pages so anyone can test your agent instantly</div>
-        </div>
-        <button class="btn btn-primary" onclick="openDemoModal()">＋ Create Demo Link</button>
-      </div>
-    </div>
-    <div id="demos-grid" style="display:grid;grid-template-columns:repeat(auto-fill,minmax(320px,1fr));gap:16px;"></div>
-  </div>
-
-  <!-- ── API Credentials ── -->
-  <!-- CRM Contacts Page -->
-  <div id="page-crm" class="page">
-    <div class="page-header">
-      <div class="page-title">👥 CRM Contacts</div>
-      <div class="page-sub">Every caller recorded automatically — name, phone, call history</div>
-    </div>
-    <div class="section-card">
-      <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:16px;">
-        <div class="section-title" style="margin:0;">All Contacts</div>
-        <button class="btn btn-ghost btn-sm" onclick="loadCRM()">&#x21bb; Refresh</button>
-      </div>
-      <div style="overflow-x:auto;">
-        <table style="width:100%;border-collapse:collapse;font-size:13px;">
-          <thead>
-            <tr style="border-bottom:1px solid var(--border);">
-              <th style="padding:10px 12px;text-align:left;color:var(--muted);font-weight:500;">Name</th>
-              <th style="padding:10px 12px;text-align:left;color:var(--muted);font-weight:500;">Phone</th>
-              <th style="padding:10px 12px;text-align:left;color:var(--muted);font-weight:500;">Total Calls</th>
-              <th style="padding:10px 12px;text-align:left;color:var(--muted);font-weight:500;">Last Seen</th>
-              <th style="padding:10px 12px;text-align:left;color:var(--muted);font-weight:500;">Status</th>
-            </tr>
-          </thead>
-          <tbody id="crm-tbody">
-            <tr><td colspan="5" style="text-align:center;padding:32px;color:var(--muted);">Loading contacts...</td></tr>
-          </tbody>
-        </table>
-      </div>
-    </div>
-  </div>
-
-  <div id="page-credentials" class="page">
-    <div class="page-header">
-      <div class="page-title">API Credentials</div>
-      <div class="page-sub">Credentials here override .env values at runtime. Never share this page.</div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">LiveKit</div>
-      <div class="form-row">
-        <div class="form-group"><label>LiveKit URL</label><input type="text" id="livekit_url" value="{_livekit_url}"></div>
-        <div class="form-group"><label>SIP Trunk ID</label><input type="text" id="sip_trunk_id" value="{_sip_trunk_id}"></div>
-        <div class="form-group"><label>API Key</label><input type="password" id="livekit_api_key" value="{_livekit_api_key}"></div>
-        <div class="form-group"><label>API Secret</label><input type="password" id="livekit_api_secret" value="{_livekit_api_sec}"></div>
-      </div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">AI Providers</div>
-      <div class="form-row">
-        <div class="form-group"><label>OpenAI API Key</label><input type="password" id="openai_api_key" value="{_openai_key}"></div>
-        <div class="form-group"><label>Sarvam API Key</label><input type="password" id="sarvam_api_key" value="{_sarvam_key}"></div>
-      </div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">Integrations</div>
-      <div class="form-row">
-        <div class="form-group"><label>Cal.com API Key</label><input type="password" id="cal_api_key" value="{_cal_key}"></div>
-        <div class="form-group"><label>Cal.com Event Type ID</label><input type="text" id="cal_event_type_id" value="{_cal_event}"></div>
-        <div class="form-group"><label>Telegram Bot Token</label><input type="password" id="telegram_bot_token" value="{_tg_token}"></div>
-        <div class="form-group"><label>Telegram Chat ID</label><input type="text" id="telegram_chat_id" value="{_tg_chat}"></div>
-        <div class="form-group"><label>Supabase URL</label><input type="text" id="supabase_url" value="{_supa_url}"></div>
-        <div class="form-group"><label>Supabase Anon Key</label><input type="password" id="supabase_key" value="{_supa_key}"></div>
-      </div>
-    </div>
-    <div class="section-card">
-      <div class="section-title">SIP Outbound & Masking</div>
-      <div class="form-row">
-        <div class="form-group"><label>Vobiz SIP Domain / IP</label><input type="text" id="vobiz_sip_domain" value="{_vobiz_sip_domain}"></div>
-        <div class="form-group"><label>Vobiz SIP Username</label><input type="text" id="vobiz_username" value="{_vobiz_username}"></div>
-        <div class="form-group"><label>Vobiz SIP Password</label><input type="password" id="vobiz_password" value="{_vobiz_password}"></div>
-        <div class="form-group"><label>Default Outbound Caller ID</label><input type="text" id="vobiz_outbound_number" value="{_vobiz_outbound_number}"></div>
-      </div>
-      <div class="form-group" style="margin-top:12px;">
-        <label>Masking Number Pool (Comma-separated)</label>
-        <textarea id="vobiz_number_pool" rows="2" placeholder="+911234567890, +910987654321">{_vobiz_pool}</textarea>
-        <div class="hint">If provided, outbound calls will randomly select one of these numbers as the Caller ID.</div>
-      </div>
-    </div>
-    <div class="save-bar">
-      <span class="save-status" id="save-status-credentials">✅ Saved!</span>
-      <button class="btn btn-primary" onclick="saveConfig('credentials')">💾 Save Credentials</button>
-    </div>
-  </div>
-
-  <!-- ── Call Logs ── -->
-  <div id="page-logs" class="page">
-    <div class="page-header">
-      <div style="display:flex;align-items:center;justify-content:space-between;">
-        <div>
-          <div class="page-title">Call Logs</div>
-          <div class="page-sub">Full history of all incoming calls and transcripts</div>
-        </div>
-        <button class="btn btn-ghost" onclick="loadLogs()">↻ Refresh</button>
-      </div>
-    </div>
-    <div class="table-wrap">
-      <table>
-        <thead>
-          <tr>
-            <th>Date & Time</th>
-            <th>Phone</th>
-            <th>Duration</th>
-            <th>Status</th>
-            <th>Summary</th>
-            <th>Actions</th>
-          </tr>
-        </thead>
-        <tbody id="logs-table-body"><tr><td colspan="6" style="text-align:center;padding:32px;color:var(--muted);">Click Refresh to load call logs</td></tr></tbody>
-      </table>
-    </div>
-  </div>
-
-</div><!-- /main -->
-
-<script>
-// ── Navigation ──────────────────────────────────────────────────────────────
-function goTo(pageId, el) {{
-  const target = document.getElementById('page-' + pageId);
-  if (!target) {{ console.warn('Page not found: page-' + pageId); return; }}
-  document.querySelectorAll('.page').forEach(p => p.classList.remove('active'));
-  document.querySelectorAll('.nav-item').forEach(n => n.classList.remove('active'));
-  target.classList.add('active');
-  if (el) el.classList.add('active');
-}}
-
-// ── Stats & Dashboard ───────────────────────────────────────────────────────
-async function loadDashboard() {{
-  // Optimistically clear Loading...
-  const tbody = document.getElementById('dash-table-body');
-  tbody.innerHTML = '<tr><td colspan="5" style="text-align:center;padding:24px;color:var(--muted);">Loading...</td></tr>';
-
-  let stats = null, logs = null;
-
-  // Fetch stats
-  try {{
-    const r = await fetch('/api/stats');
-    if (!r.ok) throw new Error('HTTP ' + r.status);
-    stats = await r.json();
-  }} catch(e) {{
-    console.error('Stats fetch failed:', e);
-  }}
-
-  // Fetch logs separately so one failure doesn't break the other
-  try {{
-    const r = await fetch('/api/logs');
-    if (!r.ok) throw new Error('HTTP ' + r.status);
-    logs = await r.json();
-  }} catch(e) {{
-    console.error('Logs fetch failed:', e);
-  }}
-
-  // ── Update stat cards ──────────────────────────────────────────────────
-  if (stats !== null) {{
-    const fmt = (v, suffix='') => (v !== null && v !== undefined) ? v + suffix : '0' + suffix;
-    document.getElementById('stat-calls').textContent    = fmt(stats.total_calls);
-    document.getElementById('stat-bookings').textContent = fmt(stats.total_bookings);
-    document.getElementById('stat-duration').textContent = fmt(stats.avg_duration, 's');
-    document.getElementById('stat-rate').textContent     = fmt(stats.booking_rate, '%');
-  }} else {{
-    ['stat-calls','stat-bookings','stat-duration','stat-rate'].forEach(id => {{
-      document.getElementById(id).textContent = '!';
-      document.getElementById(id).title = 'Could not load — check Supabase credentials';
-    }});
-  }}
-
-  // ── Update calls table ─────────────────────────────────────────────────
-  if (logs === null) {{
-    tbody.innerHTML = '<tr><td colspan="5" style="text-align:center;padding:24px;color:#e06c75;">⚠ Could not load calls — check Supabase URL and KEY in API Credentials.</td></tr>';
-    return;
-  }}
-  if (!logs.length) {{
-    tbody.innerHTML = '<tr><td colspan="5" style="text-align:center;padding:24px;color:var(--muted);">No calls yet. Make a test call!</td></tr>';
-    return;
-  }}
-  tbody.innerHTML = logs.slice(0, 20).map(log => `
-    <tr>
-      <td style="color:var(--muted)">${{new Date(log.created_at).toLocaleString()}}</td>
-      <td style="font-weight:600">${{log.phone_number || 'Unknown'}}</td>
-      <td>${{log.duration_seconds || 0}}s</td>
-      <td>${{badgeFor(log.summary)}}</td>
-      <td>
-        ${{log.id ? `<a style="color:var(--accent);font-size:12px;text-decoration:none;" href="/api/logs/${{log.id}}/transcript" download="transcript_${{log.id}}.txt">⬇ Download</a>` : ''}}
-      </td>
-    </tr>`).join('');
-}}
-
-function badgeFor(summary) {{
-  if (!summary) return '<span class="badge badge-gray">Ended</span>';
-  if (summary.toLowerCase().includes('confirm')) return '<span class="badge badge-green">✓ Booked</span>';
-  if (summary.toLowerCase().includes('cancel')) return '<span class="badge badge-yellow">✗ Cancelled</span>';
-  return '<span class="badge badge-gray">Completed</span>';
-}}
-
-// ── Call Logs ───────────────────────────────────────────────────────────────
-async function loadLogs() {{
-  const tbody = document.getElementById('logs-table-body');
-  tbody.innerHTML = '<tr><td colspan="6" style="text-align:center;padding:24px;color:var(--muted);">Loading...</td></tr>';
-  try {{
-    const logs = await fetch('/api/logs').then(r => r.json());
-    if (!logs || logs.length === 0) {{
-      tbody.innerHTML = '<tr><td colspan="6" style="text-align:center;padding:24px;color:var(--muted);">No call logs found.</td></tr>';
-      return;
-    }}
-    tbody.innerHTML = logs.map(log => `
-      <tr>
-        <td style="color:var(--muted);white-space:nowrap">${{new Date(log.created_at).toLocaleString()}}</td>
-        <td style="font-weight:600">${{log.phone_number || 'Unknown'}}</td>
-        <td>${{log.duration_seconds || 0}}s</td>
-        <td>${{badgeFor(log.summary)}}</td>
-        <td style="color:var(--muted);font-size:12px;max-width:200px;overflow:hidden;text-overflow:ellipsis;white-space:nowrap" title="${{log.summary || ''}}">${{log.summary || '—'}}</td>
-        <td>
-          ${{log.id ? `<a class="btn btn-ghost btn-sm" style="text-decoration:none;" href="/api/logs/${{log.id}}/transcript" download="transcript_${{log.id}}.txt">⬇ Transcript</a>` : '—'}}
-          ${{log.recording_url ? `<a class="btn btn-ghost btn-sm" style="text-decoration:none;margin-left:4px;" href="${{log.recording_url}}" target="_blank">🎧 Recording</a>` : ''}}
-          <button class="btn btn-ghost btn-sm" style="color:var(--red);margin-left:4px;" onclick="toggleDNC('${{log.phone_number}}')">🚫 Block</button>
-        </td>
-      </tr>`).join('');
-  }} catch(e) {{
-    tbody.innerHTML = '<tr><td colspan="6" style="text-align:center;padding:24px;color:#ef4444;">Error loading logs. Check Supabase credentials.</td></tr>';
-  }}
-}}
-
-async function toggleDNC(phone) {{
-  if (!confirm(`Add ${{phone}} to the Do-Not-Call (DNC) list? Outbound campaigns will skip this number.`)) return;
-  try {{
-    const r = await fetch('/api/dnc', {{
-      method: 'POST',
-      headers: {{'Content-Type': 'application/json'}},
-      body: JSON.stringify({{phone: phone, action: 'add'}})
-    }});
-    if (r.ok) {{
-      alert(`✅ ${{phone}} added to DNC list`);
-    }} else {{
-      const d = await r.json();
-      alert(`❌ Error: ${{d.detail || 'Failed to add to DNC'}}`);
-    }}
-  }} catch(e) {{
-    alert(`❌ Request failed: ${{e}}`);
-  }}
-}}
-
-// ── Calendar ────────────────────────────────────────────────────────────────
-let calYear = new Date().getFullYear();
-let calMonth = new Date().getMonth();
-let allBookings = [];
-
-async function loadCalendar() {{
-  try {{ allBookings = await fetch('/api/bookings').then(r => r.json()); }} catch(e) {{ allBookings = []; }}
-  renderCalendar();
-}}
-
-function changeMonth(dir) {{ calMonth += dir; if (calMonth > 11) {{ calMonth = 0; calYear++; }} else if (calMonth < 0) {{ calMonth = 11; calYear--; }} renderCalendar(); }}
-
-function renderCalendar() {{
-  const months = ['January','February','March','April','May','June','July','August','September','October','November','December'];
-  document.getElementById('cal-month-label').textContent = `${{months[calMonth]}} ${{calYear}}`;
-  const grid = document.getElementById('cal-grid');
-  const days = ['Sun','Mon','Tue','Wed','Thu','Fri','Sat'];
-  const today = new Date();
-
-  // Build booking map by date string YYYY-MM-DD
-  const bookMap = {{}};
-  allBookings.forEach(b => {{
-    const d = b.created_at ? b.created_at.slice(0,10) : null;
-    if (d) {{ bookMap[d] = bookMap[d] || []; bookMap[d].push(b); }}
-  }});
-
-  let html = days.map(d => `<div class="cal-day-name">${{d}}</div>`).join('');
-
-  const first = new Date(calYear, calMonth, 1);
-  const last = new Date(calYear, calMonth + 1, 0);
-  const startPad = first.getDay();
-
-  // Prev month padding
-  for (let i = 0; i < startPad; i++) {{
-    const d = new Date(calYear, calMonth, -startPad + i + 1);
-    html += `<div class="cal-cell other-month"><div class="cal-num">${{d.getDate()}}</div></div>`;
-  }}
-
-  for (let day = 1; day <= last.getDate(); day++) {{
-    const dateStr = `${{calYear}}-${{String(calMonth+1).padStart(2,'0')}}-${{String(day).padStart(2,'0')}}`;
-    const bks = bookMap[dateStr] || [];
-    const isToday = today.getFullYear()===calYear && today.getMonth()===calMonth && today.getDate()===day;
-    html += `<div class="cal-cell${{isToday?' today':''}}" onclick="showDay('${{dateStr}}', ${{JSON.stringify(bks).replace(/'/g,"&apos;")}})">
-      <div class="cal-num">${{day}}</div>
-      ${{bks.length ? `<div class="cal-dot"></div><div class="cal-booking-count">${{bks.length}} booking${{bks.length>1?'s':''}}</div>` : ''}}
-    </div>`;
-  }}
-
-  // Next month padding
-  const endPad = 6 - last.getDay();
-  for (let i = 1; i <= endPad; i++) {{
-    html += `<div class="cal-cell other-month"><div class="cal-num">${{i}}</div></div>`;
-  }}
-
-  grid.innerHTML = html;
-  document.getElementById('day-panel').classList.remove('show');
-}}
-
-function showDay(dateStr, bookings) {{
-  // Update old inline panel too
-  const panel = document.getElementById('day-panel');
-  if (panel) {{
-    panel.classList.add('show');
-    document.getElementById('day-panel-title').textContent = `Bookings on ${{dateStr}}`;
-  }}
-  // Open modal overlay
-  openDayModal(dateStr, bookings);
-}}
-
-function openDayModal(dateStr, bookings) {{
-  const modal = document.getElementById('day-modal');
-  const dateObj = new Date(dateStr + 'T00:00:00');
-  const formatted = dateObj.toLocaleDateString('en-IN', {{weekday:'long', year:'numeric', month:'long', day:'numeric'}});
-  document.getElementById('modal-date-title').textContent = formatted;
-  document.getElementById('modal-date-sub').textContent =
-    bookings.length ? `${{bookings.length}} booking${{bookings.length>1?'s':''}} on this day` : 'No bookings on this day';
-
-  if (!bookings || bookings.length === 0) {{
-    document.getElementById('modal-bookings-body').innerHTML =
-      '<div style="text-align:center;padding:32px;color:var(--muted);font-size:14px;">📅 No bookings on this day.</div>';
-  }} else {{
-    document.getElementById('modal-bookings-body').innerHTML = bookings.map(b => `
-      <div class="booking-item">
-        <div style="display:flex;align-items:center;justify-content:space-between;">
-          <div style="font-weight:700;font-size:14px;">📞 ${{b.phone_number || 'Unknown'}}</div>
-          <span class="badge badge-green">✅ Booked</span>
-        </div>
-        <div style="font-size:12px;color:var(--muted);margin-top:6px;">🕐 ${{new Date(b.created_at).toLocaleTimeString('en-IN', {{hour:'2-digit',minute:'2-digit'}})}}</div>
-        ${{b.summary ? `<div style="font-size:12px;color:var(--text);margin-top:6px;padding:8px;background:rgba(255,255,255,0.04);border-radius:6px;">💬 ${{b.summary}}</div>` : ''}}
-      </div>`).join('');
-  }}
-  modal.classList.add('open');
-}}
-
-function closeDayModal() {{
-  document.getElementById('day-modal').classList.remove('open');
-}}
-document.addEventListener('keydown', e => {{ if (e.key === 'Escape') closeDayModal(); }});
-
-// ── CRM ─────────────────────────────────────────────────────────────────────
-async function loadCRM() {{
-  const tbody = document.getElementById('crm-tbody');
-  if (!tbody) return;
-  tbody.innerHTML = '<tr><td colspan="5" style="text-align:center;padding:32px;color:var(--muted);">Loading contacts...</td></tr>';
-  try {{
-    const contacts = await fetch('/api/contacts').then(r => r.json());
-    if (!contacts.length) {{
-      tbody.innerHTML = '<tr><td colspan="5" style="text-align:center;padding:40px;color:var(--muted);">No contacts yet. They will appear here automatically after calls.</td></tr>';
-      return;
-    }}
-    tbody.innerHTML = contacts.map(c => `
-      <tr style="border-bottom:1px solid var(--border);transition:background 0.12s;" onmouseover="this.style.background='rgba(255,255,255,0.025)'" onmouseout="this.style.background=''">
-        <td style="padding:14px 16px;font-weight:600;">${{c.caller_name || '<span style="color:var(--muted);font-weight:400;">Unknown</span>'}}</td>
-        <td style="padding:14px 16px;font-family:monospace;font-size:13px;">${{c.phone_number || '—'}}</td>
-        <td style="padding:14px 16px;text-align:center;"><span style="background:rgba(108,99,255,0.12);color:var(--accent);padding:3px 10px;border-radius:20px;font-size:12px;font-weight:700;">${{c.total_calls}}</span></td>
-        <td style="padding:14px 16px;color:var(--muted);font-size:12px;">${{c.last_seen ? new Date(c.last_seen).toLocaleString('en-IN') : '—'}}</td>
-        <td style="padding:14px 16px;">${{c.is_booked
-          ? '<span class="badge badge-green">✅ Booked</span>'
-          : '<span class="badge badge-gray">📵 No booking</span>'}}</td>
-      </tr>`).join('');
-  }} catch(e) {{
-    tbody.innerHTML = '<tr><td colspan="5" style="text-align:center;padding:24px;color:#ef4444;">Error loading contacts. Check Supabase credentials.</td></tr>';
-  }}
-}}
-
-// ── Save Config ─────────────────────────────────────────────────────────────
-async function saveConfig(section) {{
-  const get = id => {{
-    const el = document.getElementById(id);
-    return el ? el.value : null;
-  }};
-  const payload = {{}};
-  if (section === 'agent' || section === 'system') {{
-    Object.assign(payload, {{
-      first_line:                get('first_line'),
-      // opening_greeting is only in the Agent Modal, not on this page
-      agent_instructions:        get('agent_instructions'),
-      stt_min_endpointing_delay: parseFloat(get('stt_min_endpointing_delay') || '0.6'),
-      tts_voice:                 get('tts_voice'),
-      tts_language:              get('tts_language'),
-      stt_language:              get('stt_language') || get('tts_language') || 'hi-IN',
-    }});
-  }} else if (section === 'models') {{
-    Object.assign(payload, {{
-      llm_model:    get('llm_model'),
-      temperature:  parseFloat(get('temperature') || '0.3'),
-      max_tokens:   parseInt(get('max_tokens') || '400'),
-    }});
-  }} else if (section === 'credentials') {{
-    Object.assign(payload, {{
-      livekit_url:          get('livekit_url'),
-      sip_trunk_id:         get('sip_trunk_id'),
-      livekit_api_key:      get('livekit_api_key'),
-      livekit_api_secret:   get('livekit_api_secret'),
-      openai_api_key:       get('openai_api_key'),
-      sarvam_api_key:       get('sarvam_api_key'),
-      cal_api_key:          get('cal_api_key'),
-      cal_event_type_id:    get('cal_event_type_id'),
-      telegram_bot_token:   get('telegram_bot_token'),
-      telegram_chat_id:     get('telegram_chat_id'),
-      supabase_url:         get('supabase_url'),
-      supabase_key:         get('supabase_key'),
-      vobiz_sip_domain:     get('vobiz_sip_domain'),
-      vobiz_username:       get('vobiz_username'),
-      vobiz_password:       get('vobiz_password'),
-      vobiz_outbound_number: get('vobiz_outbound_number'),
-      vobiz_number_pool:    get('vobiz_number_pool'),
-    }});
-  }}
-
-  console.log('[SAVE] Saving config section:', section);
-  console.log('[SAVE] Payload:', payload);
-
-  try {{
-    const res = await fetch('/api/config', {{
-      method: 'POST',
-      headers: {{ 'Content-Type': 'application/json' }},
-      body: JSON.stringify(payload),
-    }});
-
-    const saved = await res.json();
-    console.log('[SAVE] Server response:', saved);
-    const statusEl = document.getElementById(`save-status-${{section}}`);
-
-    if (res.ok) {{
-      // Repopulate fields from server response so UI shows what was actually saved
-      Object.entries(saved).forEach(([key, val]) => {{
-        const el = document.getElementById(key);
-        if (el && val !== null && val !== undefined) el.value = val;
-      }});
-      if (statusEl) {{ statusEl.style.opacity = 1; setTimeout(() => statusEl.style.opacity = 0, 2500); }}
-
-      // ── Also sync directly to the active agent DB row ──
-      // DB takes priority over config.json on every call, so we must keep both in sync.
-      if (section === 'agent' || section === 'system') {{
-        fetch('/api/active-agent', {{
-          method: 'PUT',
-          headers: {{ 'Content-Type': 'application/json' }},
-          body: JSON.stringify({{
-            agentinstructions:      get('agent_instructions'),
-            firstline:             get('first_line'),
-            ttsvoice:              get('tts_voice'),
-            ttslanguage:           get('tts_language'),
-            sttminendpointingdelay: parseFloat(get('stt_min_endpointing_delay') || '0.5'),
-          }}),
-        }}).then(r => {{
-          if (!r.ok) console.warn('[SAVE] DB sync failed:', r.status);
-          else console.log('[SAVE] Active agent DB synced.');
-        }}).catch(e => console.warn('[SAVE] DB sync error:', e));
-      }}
-    }} else {{
-      const errMsg = saved.detail || saved.error || 'Unknown error';
-      console.error('[SAVE] Failed:', errMsg);
-      alert('Save failed: ' + errMsg);
-    }}
-  }} catch(e) {{
-    console.error('[SAVE] Request failed:', e);
-    alert('Network error: ' + e.message);
-  }}
-}}
-
-// ── Language Presets ─────────────────────────────────────────────────────────
-const PRESETS = {{
-  hindi:       {{stt:'hi-IN',tts:'hi-IN',voice:'rohan', label:'Hindi',    greeting:"Namaste! Daisy's Med Spa mein aapka swagat hai. Main aapki kaise madad kar sakti hoon?"}},
-  english:     {{stt:'en-IN',tts:'en-IN',voice:'dev',   label:'English',  greeting:"Hello! Welcome to Daisy's Med Spa. How can I help you today?"}},
-  tamil:       {{stt:'ta-IN',tts:'ta-IN',voice:'kavya', label:'Tamil',    greeting:"Vanakkam! Daisy's Med Spa-vil ungalai varkarpom. Naan ungalukku eppadi udavalam?"}},
-  telugu:      {{stt:'te-IN',tts:'te-IN',voice:'shreya',label:'Telugu',   greeting:"Namaskaram! Daisy's Med Spa ki swaagatam. Meeru ela help kavalaano?"}},
-  kannada:     {{stt:'kn-IN',tts:'kn-IN',voice:'neha',  label:'Kannada',  greeting:"Namaskara! Daisy's Med Spa ge swaagatha. Naanu nimage hege sahaya maadali?"}},
-  gujarati:    {{stt:'gu-IN',tts:'gu-IN',voice:'priya', label:'Gujarati', greeting:"Namaste! Daisy's Med Spa ma apnu swagat che. Hu tamne kevi rite madad kari shakun?"}},
-  bengali:     {{stt:'bn-IN',tts:'bn-IN',voice:'ritu',  label:'Bengali',  greeting:"Namaskar! Daisy's Med Spa-te apnake swagat. Ami apnake kemon sahajata korte pari?"}},
-  marathi:     {{stt:'mr-IN',tts:'mr-IN',voice:'kavya', label:'Marathi',  greeting:"Namaskar! Daisy's Med Spa madhe aapale swagat aahe. Mi tumhala kashi madad karu shkto?"}},
-  malayalam:   {{stt:'ml-IN',tts:'ml-IN',voice:'priya', label:'Malayalam',greeting:"Namaskaram! Daisy's Med Spa-il swagatham. Ente sahayam enthu?"}},
-  hinglish:    {{stt:'hi-IN',tts:'hi-IN',voice:'rohan', label:'Hinglish', greeting:"Namaste! Welcome to Daisy's Med Spa. Main aapki kaise help kar sakti hoon?"}},
-  multilingual:{{stt:'hi-IN',tts:'hi-IN',voice:'rohan', label:'Multilingual',greeting:"Namaste! Welcome to Daisy's Med Spa. Please speak any language — Hindi, English, Tamil, Telugu — and I'll respond in the same language."}},
-}};
-
-async function applyPreset(key) {{
-  const p = PRESETS[key]; if (!p) return;
-  const setV = (id,v) => {{ const e=document.getElementById(id); if(e) e.value=v; }};
-  setV('tts_language', p.tts); setV('tts_voice', p.voice); setV('first_line', p.greeting);
-  const res = await fetch('/api/config', {{
-    method:'POST', headers:{{'Content-Type':'application/json'}},
-    body: JSON.stringify({{tts_language:p.tts, stt_language:p.stt, tts_voice:p.voice, first_line:p.greeting}})
-  }});
-  const st = document.getElementById('preset-status');
-  if (st) {{ st.textContent = res.ok ? '✅ '+p.label+' preset applied!' : '❌ Failed'; st.style.color = res.ok ? 'var(--green)':'var(--red)'; }}
-}}
-
-// ── Agents ────────────────────────────────────────────────────────────────────
-let editingAgentId = null;
-
-async function loadAgents() {{
-  const g = document.getElementById('agents-grid'); if (!g) return;
-  g.innerHTML = '<div style="color:var(--muted);padding:20px;">Loading...</div>';
-  const agents = await fetch('/api/agents').then(r=>r.json()).catch(()=>[]);
-  if (!agents.length) {{ g.innerHTML='<div style="color:var(--muted);padding:20px;">No agents yet. Click + New Agent to create one.</div>'; return; }}
-  g.innerHTML = agents.map(a=>{{
-    const isInbound  = a.is_inbound_active;
-    const isOutbound = a.is_outbound_active;
-    const badges = [
-      isInbound  ? '<span class="badge" style="background:rgba(74,222,128,.15);color:#4ade80;border:1px solid rgba(74,222,128,.3);">📞 Inbound</span>'  : '',
-      isOutbound ? '<span class="badge" style="background:rgba(96,165,250,.15);color:#60a5fa;border:1px solid rgba(96,165,250,.3);">📤 Outbound</span>' : '',
-    ].filter(Boolean).join(' ');
-    return `
-    <div class="agent-card${{isInbound?' active':''}}">
-      <div style="display:flex;align-items:center;justify-content:space-between;margin-bottom:8px;">
-        <div style="font-weight:700;">🤖 ${{a.name}}</div>
-        <div>${{badges}}</div>
-      </div>
-      <div style="font-size:12px;color:var(--muted);margin-bottom:12px;">
-        🌐 ${{a.tts_language||'hi-IN'}} · 🎙 ${{a.tts_voice||'rohan'}} · 🧠 ${{a.llm_model||'gpt-4.1-mini'}}
-      </div>
-      <div style="display:flex;gap:8px;flex-wrap:wrap;">
-        ${{!isInbound  ? `<button class="btn btn-primary btn-sm" onclick="activateInboundAgent('${{a.id}}')">📞 Set Inbound</button>` : ''}}
-        ${{!isOutbound ? `<button class="btn btn-ghost btn-sm" style="border:1px solid rgba(96,165,250,.4);color:#60a5fa;" onclick="activateOutboundAgent('${{a.id}}')">📤 Set Outbound</button>` : ''}}
-        <button class="btn btn-ghost btn-sm" onclick='editAgent(${{JSON.stringify(a)}})'>✏ Edit</button>
-        ${{a.id!=='default'?`<button class="btn btn-ghost btn-sm" style="color:var(--red)" onclick="deleteAgent('${{a.id}}')">🗑</button>`:''}}
-      </div>
-    </div>`;
-  }}).join('');
-}}
-
-async function activateAgent(id) {{ await activateInboundAgent(id); }}
-async function activateInboundAgent(id) {{
-  const res = await fetch('/api/agents/'+id+'/activate-inbound',{{method:'POST'}});
-  if (!res.ok) {{ alert('Failed to set inbound agent'); return; }}
-  loadAgents();
-}}
-async function activateOutboundAgent(id) {{
-  const res = await fetch('/api/agents/'+id+'/activate-outbound',{{method:'POST'}});
-  if (!res.ok) {{ alert('Failed to set outbound agent'); return; }}
-  loadAgents();
-}}
-async function deleteAgent(id) {{
-  if (!confirm('Delete this agent?')) return;
-  await fetch('/api/agents/'+id,{{method:'DELETE'}}); loadAgents();
-}}
-function editAgent(agent) {{
-  editingAgentId = agent.id;
-  const setVal = (id, val) => {{ const el = document.getElementById(id); if (el) el.value = (val !== undefined && val !== null) ? val : ''; }};
-  const setOpt = (id, val) => {{ const el = document.getElementById(id); if (el && val) el.value = val; }};
-  setVal('am-name',             agent.name                                       || '');
-  setOpt('am-tts-lang',        agent.tts_language  || agent.ttslanguage          || 'hi-IN');
-  setOpt('am-voice',           agent.tts_voice     || agent.ttsvoice             || 'rohan');
-  setOpt('am-stt-provider',    agent.stt_provider  || agent.sttprovider          || 'sarvam');
-  setOpt('am-stt-lang',        agent.stt_language  || agent.sttlanguage          || 'unknown');
-  setOpt('am-llm-provider',    agent.llm_provider  || agent.llmprovider          || 'openai');
-  onProviderChange();  // repopulate model list for the stored provider
-  setOpt('am-llm',             agent.llm_model     || agent.llmmodel             || 'gpt-4.1-mini');
-  setVal('am-stt-delay',       agent.stt_min_endpointing_delay || agent.sttminendpointingdelay || 0.5);
-  setVal('am-max-turns',       agent.max_turns     || agent.maxturns             || 25);
-  setVal('am-first-line',      agent.first_line    || agent.firstline            || '');
-  setVal('am-opening-greeting',agent.openinggreeting || agent.opening_greeting   || '');
-  setVal('am-instructions',    agent.agent_instructions || agent.agentinstructions || '');
-  setVal('am-temperature',     agent.temperature !== undefined ? agent.temperature : 0.3);
-  setVal('am-max-tokens',      agent.max_tokens  !== undefined ? agent.max_tokens  : 400);
-  document.getElementById('agent-modal').classList.add('open');
-}}
-function openAgentModal() {{ editingAgentId=null; document.getElementById('agent-modal').classList.add('open'); }}
-function closeAgentModal() {{ document.getElementById('agent-modal').classList.remove('open'); }}
-async function saveAgent() {{
-  const g = id => document.getElementById(id)?.value;
-  const provider = g('am-llm-provider') || 'openai';
-  const data = {{
-    name:                   g('am-name'),
-    ttslanguage:            g('am-tts-lang'),
-    ttsvoice:               g('am-voice'),
-    sttprovider:            g('am-stt-provider'),
-    sttlanguage:            g('am-stt-lang'),
-    llmprovider:            provider,
-    llmmodel:               g('am-llm'),
-    sttminendpointingdelay: parseFloat(g('am-stt-delay') || '0.5'),
-    firstline:              g('am-first-line'),
-    openinggreeting:        g('am-opening-greeting'),
-    agentinstructions:      g('am-instructions'),
-    temperature:            parseFloat(g('am-temperature') || '0.3'),
-    max_tokens:             parseInt(g('am-max-tokens') || '400'),
-    maxturns:               parseInt(g('am-max-turns') || '25'),
-    // Provider-specific API key (only when non-OpenAI)
-    ...(provider === 'groq'       ? {{ groqapikey:       g('am-api-key') }} : {{}}),
-    ...(provider === 'anthropic'  ? {{ anthropicapikey:  g('am-api-key') }} : {{}}),
-    ...(provider === 'openrouter' ? {{ openrouterapikey: g('am-api-key') }} : {{}}),
-  }};
-  console.log('[AGENT SAVE]', data);
-  const url = editingAgentId ? `/api/agents/${{editingAgentId}}` : '/api/agents';
-  const method = editingAgentId ? 'PUT' : 'POST';
-  const res = await fetch(url, {{ method, headers: {{ 'Content-Type': 'application/json' }}, body: JSON.stringify(data) }});
-  if (!res.ok) {{ const e = await res.json().catch(()=>({{}})); alert('Save failed: '+(e.detail||'check logs')); return; }}
-  closeAgentModal();
-  loadAgents();
-}}
-
-// ── LLM Provider → dynamic model list ─────────────────────────────────────────
-const PROVIDER_MODELS = {{
-  openai:     ['gpt-4.1-mini','gpt-4o-mini','gpt-4o','gpt-4-turbo','o1-mini'],
-  groq:       ['llama-3.3-70b-versatile','llama-3.1-70b-versatile','mixtral-8x7b-32768','gemma2-9b-it'],
-  anthropic:  ['claude-3-5-haiku-20241022','claude-3-5-sonnet-20241022','claude-3-opus-20240229'],
-  openrouter: ['openai/gpt-4o-mini','anthropic/claude-3.5-haiku','meta-llama/llama-3.3-70b-instruct:free','google/gemma-2-9b-it:free'],
-}};
-
-function onProviderChange() {{
-  const provider  = document.getElementById('am-llm-provider')?.value || 'openai';
-  const modelSel  = document.getElementById('am-llm');
-  const keyRow    = document.getElementById('am-api-key-row');
-  const keyLabel  = document.getElementById('am-api-key-label');
-  if (modelSel) {{
-    modelSel.innerHTML = (PROVIDER_MODELS[provider] || PROVIDER_MODELS.openai).map(m =>
-      `<option value="${{m}}">${{m}}</option>`
-    ).join('');
-  }}
-  if (keyRow) {{
-    keyRow.style.display = provider === 'openai' ? 'none' : '';
-    if (keyLabel) keyLabel.textContent = {{
-      groq: 'Groq API Key', anthropic: 'Anthropic API Key', openrouter: 'OpenRouter API Key',
-    }}[provider] || 'API Key';
-  }}
-}}
-
-// Prompt analyzer — fires as user types in the instructions textarea
-document.getElementById('am-instructions')?.addEventListener('input', debounce(async function() {{
-  const prompt = this.value.trim();
-  const badge = document.getElementById('prompt-analyzer-badge');
-  if (!prompt) {{ badge.style.display = 'none'; return; }}
-  badge.style.display = 'block';
-  try {{
-    const r = await fetch('/api/analyze-prompt', {{
-      method: 'POST',
-      headers: {{ 'Content-Type': 'application/json' }},
-      body: JSON.stringify({{ prompt }}),
-    }});
-    const d = await r.json();
-    const colors = {{ healthy: '#4ade80', large: '#fbbf24', too_large: '#f87171', too_short: '#a78bfa' }};
-    document.getElementById('pa-token-count').textContent = `${{d.token_count}} tokens`;
-    const sl = document.getElementById('pa-status-label');
-    sl.textContent = d.status.replace('_', ' ').toUpperCase();
-    sl.style.background = (colors[d.status] || '#94a3b8') + '22';
-    sl.style.color = colors[d.status] || '#94a3b8';
-    document.getElementById('pa-recommendation').textContent = d.recommendation;
-  }} catch(e) {{}}
-}}, 600));
-
-function debounce(fn, delay) {{
-  let t; return function(...args) {{ clearTimeout(t); t = setTimeout(() => fn.apply(this, args), delay); }};
-}}
-
-// ── Outbound Calls ────────────────────────────────────────────────────────────
-let activeBulkJobId = null, bulkPollTimer = null;
-
-async function dispatchSingleCall() {{
-  const phone = (document.getElementById('single-phone')||{{}}).value||''.trim();
-  const st = document.getElementById('single-call-status');
-  if (!phone) {{ st.textContent='❌ Enter a phone number'; return; }}
-  st.textContent='⏳ Dispatching...';
-  const res = await fetch('/api/call/outbound',{{method:'POST',headers:{{'Content-Type':'application/json'}},body:JSON.stringify({{phone_number:phone}})}}).catch(e=>{{st.textContent='❌ '+e.message;return null;}});
-  if (!res) return;
-  const d = await res.json();
-  if (res.ok) {{
-    st.innerHTML='<span style="color:var(--green)">✅ Dispatched! Room: '+d.room+'</span>';
-    const log=document.getElementById('outbound-log');
-    log.innerHTML='<div style="padding:10px;background:rgba(34,197,94,0.08);border-radius:8px;margin-bottom:8px;">📞 '+phone+' — Dispatched</div>'+log.innerHTML;
-  }} else st.innerHTML='<span style="color:var(--red)">❌ '+(d.detail||'Error')+'</span>';
-}}
-
-async function startBulkCampaign() {{
-  const raw=(document.getElementById('bulk-phones')||{{}}).value||'';
-  const numbers=raw.split(String.fromCharCode(10)).map(n=>n.trim()).filter(Boolean);
-  if (!numbers.length) return;
-  const res = await fetch('/api/call/bulk',{{method:'POST',headers:{{'Content-Type':'application/json'}},body:JSON.stringify({{numbers}})}});
-  const d = await res.json();
-  activeBulkJobId = d.job_id;
-  document.getElementById('bulk-progress').innerHTML='<span style="color:var(--accent)">🚀 Campaign '+d.job_id+' — '+d.total+' numbers</span>';
-  bulkPollTimer = setInterval(pollBulkStatus, 3000);
-}}
-
-async function pollBulkStatus() {{
-  if (!activeBulkJobId) return;
-  const d = await fetch('/api/call/bulk/'+activeBulkJobId).then(r=>r.json()).catch(()=>null);
-  if (!d) return;
-  const log=document.getElementById('outbound-log');
-  log.innerHTML = d.results.map(r=>'<div style="padding:8px 12px;border-bottom:1px solid var(--border);font-size:12px;">📞 '+r.phone+' — <b style="color:'+(r.status==='dispatched'?'var(--green)':'var(--red)')+'">'+r.status+'</b></div>').join('');
-  document.getElementById('bulk-progress').innerHTML='Progress: '+d.done+'/'+d.total+' — <b>'+d.status+'</b>';
-  if (['completed','stopped'].includes(d.status)) {{ clearInterval(bulkPollTimer); activeBulkJobId=null; }}
-}}
-
-async function stopBulkCampaign() {{
-  if (!activeBulkJobId) return;
-  await fetch('/api/call/bulk/'+activeBulkJobId+'/stop',{{method:'POST'}});
-  clearInterval(bulkPollTimer);
-}}
-
-// ── Campaigns ─────────────────────────────────────────────────────────────────
-let _liveCalls = {{}};
-
-async function loadCampaigns() {{
-  const el = document.getElementById('campaigns-list'); if (!el) return;
-  el.innerHTML = '<div style="color:var(--muted);padding:20px;">Loading...</div>';
-
-  // Also populate agent + trunk selectors in the modal
-  try {{
-    const [agentsData, trunksData] = await Promise.all([
-      fetch('/api/agents').then(r=>r.json()),
-      fetch('/api/sip-trunks').then(r=>r.json()).catch(()=>({{trunks:[]}}))
-    ]);
-    const asel = document.getElementById('camp-agent-id');
-    if (asel) {{
-      asel.innerHTML = '<option value="">— No agent assigned —</option>' +
-        (Array.isArray(agentsData)?agentsData:(agentsData.agents||[])).map(a=>`<option value="${{a.id}}">${{a.name}}${{a.is_active?' ★':''}}</option>`).join('');
-    }}
-    const tsel = document.getElementById('camp-trunk-id');
-    if (tsel) {{
-      tsel.innerHTML = '<option value="">— Default trunk —</option>' +
-        (trunksData.trunks||[]).map(t=>`<option value="${{t.id}}">${{t.name}} (${{t.provider}})</option>`).join('');
-    }}
-  }} catch(e) {{ /* ignore */ }}
-
-  const data = await fetch('/api/campaigns').then(r=>r.json()).catch(()=>({{campaigns:[]}}));
-  const campaigns = data.campaigns || [];
-  if (!campaigns.length) {{
-    el.innerHTML = '<div class="section-card" style="color:var(--muted)">No campaigns yet. Click "+ New Campaign" to create one.</div>';
-    return;
-  }}
-
-  // Load stats for each campaign
-  const statsAll = await Promise.all(campaigns.map(c =>
-    fetch(`/api/campaigns/${{c.id}}/stats`).then(r=>r.json()).catch(()=>({{leads:{{total:0,pending:0,calling:0,completed:0,failed:0}}}}))
-  ));
-
-  el.innerHTML = campaigns.map((c, idx) => {{
-    const s = (statsAll[idx]||{{}}).leads || {{}};
-    const statusColor = {{'active':'#4ade80','paused':'#fbbf24','completed':'#6b7280','draft':'#a78bfa'}}[c.status]||'#94a3b8';
-    const isActive = c.status === 'active';
-    return `
-    <div class="section-card">
-      <div style="display:flex;justify-content:space-between;align-items:flex-start;gap:12px;flex-wrap:wrap;">
-        <div style="flex:1;min-width:0;">
-          <div style="display:flex;align-items:center;gap:10px;flex-wrap:wrap;">
-            <div style="font-weight:700;font-size:15px;">📋 ${{c.name}}</div>
-            <span style="font-size:11px;font-weight:600;color:${{statusColor}};background:${{statusColor}}22;padding:2px 8px;border-radius:12px;text-transform:uppercase;">●&nbsp;${{c.status}}</span>
-            ${{c.agent_name ? `<span style="font-size:11px;color:var(--muted);">${{c.agent_name}}</span>` : ''}}
-          </div>
-          <div style="margin-top:8px;display:flex;gap:20px;font-size:12px;color:var(--muted);flex-wrap:wrap;">
-            <span>📋 Total: <strong style="color:var(--text);">${{s.total||0}}</strong></span>
-            <span>⏳ Pending: <strong style="color:#fbbf24;">${{s.pending||0}}</strong></span>
-            <span>📞 Calling: <strong style="color:#4ade80;">${{s.calling||0}}</strong></span>
-            <span>✅ Done: <strong style="color:#6b7280;">${{s.completed||0}}</strong></span>
-            <span>❌ Failed: <strong style="color:#f87171;">${{s.failed||0}}</strong></span>
-          </div>
-          ${{c.notes ? `<div style="font-size:12px;color:var(--muted);margin-top:4px;">📝 ${{c.notes}}</div>` : ''}}
-        </div>
-        <div style="display:flex;gap:8px;flex-shrink:0;flex-wrap:wrap;">
-          <button class="btn btn-ghost" style="font-size:12px;padding:6px 12px;" onclick="openLeadsModal(${{c.id}})">📁 Leads</button>
-          ${{isActive
-            ? `<button class="btn btn-ghost" style="font-size:12px;padding:6px 12px;color:#fbbf24;" onclick="pauseCampaign(${{c.id}})">⏸ Pause</button>`
-            : `<button class="btn btn-primary" style="font-size:12px;padding:6px 12px;" onclick="startCampaign(${{c.id}})">▶ Start</button>`
-          }}
-        </div>
-      </div>
-    </div>`;
-  }}).join('');
-}}
-
-async function startCampaign(id) {{
-  const r = await fetch(`/api/campaigns/${{id}}/start`, {{method:'POST'}});
-  if (!r.ok) {{ alert('Failed to start campaign'); return; }}
-  loadCampaigns();
-}}
-
-async function pauseCampaign(id) {{
-  await fetch(`/api/campaigns/${{id}}/pause`, {{method:'POST'}});
-  loadCampaigns();
-}}
-
-function openCampaignModal() {{
-  document.getElementById('camp-name').value = '';
-  document.getElementById('camp-maxconc').value = '5';
-  document.getElementById('camp-cpm').value = '5';
-  document.getElementById('camp-maxretries').value = '2';
-  document.getElementById('camp-retry').checked = true;
-  document.getElementById('camp-notes').value = '';
-  document.getElementById('camp-modal-error').style.display = 'none';
-  document.getElementById('campaign-modal-overlay').style.display = 'flex';
-}}
-
-function closeCampaignModal(e) {{
-  if (e && e.target !== document.getElementById('campaign-modal-overlay')) return;
-  document.getElementById('campaign-modal-overlay').style.display = 'none';
-}}
-
-async function submitCampaign() {{
-  const name     = document.getElementById('camp-name').value.trim();
-  const agentId  = document.getElementById('camp-agent-id')?.value || '';
-  const trunkId  = document.getElementById('camp-trunk-id')?.value || '';
-  const maxConc  = parseInt(document.getElementById('camp-maxconc').value) || 5;
-  const cpm      = parseInt(document.getElementById('camp-cpm').value) || 5;
-  const retries  = parseInt(document.getElementById('camp-maxretries').value) ?? 2;
-  const retry    = document.getElementById('camp-retry')?.checked ?? true;
-  const notes    = document.getElementById('camp-notes').value.trim();
-  const errEl    = document.getElementById('camp-modal-error');
-  if (!name) {{ errEl.textContent = 'Campaign name is required.'; errEl.style.display='block'; return; }}
-  errEl.style.display = 'none';
-  try {{
-    const r = await fetch('/api/campaigns', {{
-      method:'POST', headers:{{'Content-Type':'application/json'}},
-      body:JSON.stringify({{
-        name,
-        agent_id: agentId || null,
-        sip_trunk_id: trunkId ? parseInt(trunkId) : null,
-        max_concurrent_calls: maxConc,
-        calls_per_minute: cpm,
-        max_retries: retries,
-        retry_failed: retry,
-        notes
-      }})
-    }});
-    if (!r.ok) throw new Error('Server error ' + r.status);
-    document.getElementById('campaign-modal-overlay').style.display = 'none';
-    loadCampaigns();
-  }} catch(e) {{ errEl.textContent = '❌ Failed: ' + e.message; errEl.style.display='block'; }}
-}}
-
-function openLeadsModal(campaignId) {{
-  document.getElementById('leads-upload-campaign-id').value = campaignId;
-  document.getElementById('leads-file').value = '';
-  document.getElementById('leads-upload-result').style.display = 'none';
-  document.getElementById('leads-modal-overlay').style.display = 'flex';
-}}
-
-function closeLeadsModal() {{
-  document.getElementById('leads-modal-overlay').style.display = 'none';
-}}
-
-async function uploadLeads() {{
-  const campaignId = document.getElementById('leads-upload-campaign-id').value;
-  const fileInput  = document.getElementById('leads-file');
-  const resultEl   = document.getElementById('leads-upload-result');
-  if (!fileInput.files.length) {{ resultEl.textContent = '⚠ Please select a CSV file'; resultEl.style.color='#fbbf24'; resultEl.style.display='block'; return; }}
-  resultEl.textContent = 'Uploading...';
-  resultEl.style.color = 'var(--muted)';
-  resultEl.style.display = 'block';
-  const formData = new FormData();
-  formData.append('file', fileInput.files[0]);
-  try {{
-    const r = await fetch(`/api/campaigns/${{campaignId}}/leads/upload`, {{method:'POST', body:formData}});
-    const d = await r.json();
-    if (!r.ok) {{ resultEl.textContent = '❌ ' + (d.detail || 'Upload failed'); resultEl.style.color='#f87171'; return; }}
-    resultEl.textContent = `✅ ${{d.message}}`;
-    resultEl.style.color = '#4ade80';
-    loadCampaigns();
-  }} catch(e) {{ resultEl.textContent = '❌ ' + e.message; resultEl.style.color='#f87171'; }}
-}}
-
-// ── WebSocket Live Calls ──────────────────────────────────────────────────────
-function initLiveCallsWS() {{
-  const proto = location.protocol === 'https:' ? 'wss' : 'ws';
-  const ws = new WebSocket(`${{proto}}://${{location.host}}/ws/calls`);
-  const badge = document.getElementById('live-calls-badge');
-  const tbl   = document.getElementById('live-calls-table');
-  const wsStatus = document.getElementById('ws-status');
-
-  ws.onopen = () => {{ if(wsStatus) wsStatus.textContent = '🟢 Connected'; }};
-  ws.onclose = () => {{
-    if(wsStatus) wsStatus.textContent = '🔴 Disconnected';
-    setTimeout(initLiveCallsWS, 5000); // reconnect
-  }};
-  ws.onerror = () => {{ if(wsStatus) wsStatus.textContent = '⚠ WS Error'; }};
-
-  ws.onmessage = (evt) => {{
-    try {{
-      const msg = JSON.parse(evt.data);
-      if (msg.type === 'call_status') {{
-        if (msg.status === 'calling') {{
-          _liveCalls[msg.lead_id] = msg;
-        }} else {{
-          delete _liveCalls[msg.lead_id];
-        }}
-        renderLiveCalls();
-      }}
-    }} catch(e) {{ /* ignore */ }}
-  }};
-  // Keep-alive ping every 20s
-  setInterval(() => {{ if(ws.readyState===1) ws.send('ping'); }}, 20000);
-}}
-
-function renderLiveCalls() {{
-  const calls = Object.values(_liveCalls);
-  const badge = document.getElementById('live-calls-badge');
-  const tbl   = document.getElementById('live-calls-table');
-  if (!tbl) return;
-  if (badge) badge.textContent = `${{calls.length}} active`;
-  if (!calls.length) {{ tbl.innerHTML = '<span style="color:var(--muted);">No active calls right now.</span>'; return; }}
-  tbl.innerHTML = `<table style="width:100%;border-collapse:collapse;">
-    <thead><tr style="border-bottom:1px solid var(--border);">
-      <th style="padding:8px 12px;text-align:left;color:var(--muted);font-weight:500;font-size:12px;">Phone</th>
-      <th style="padding:8px 12px;text-align:left;color:var(--muted);font-weight:500;font-size:12px;">Name</th>
-      <th style="padding:8px 12px;text-align:left;color:var(--muted);font-weight:500;font-size:12px;">Room</th>
-      <th style="padding:8px 12px;text-align:left;color:var(--muted);font-weight:500;font-size:12px;">Started</th>
-    </tr></thead>
-    <tbody>${{calls.map(c=>`<tr style="border-bottom:1px solid var(--border);">
-      <td style="padding:8px 12px;">${{c.phone}}</td>
-      <td style="padding:8px 12px;">${{c.name||'—'}}</td>
-      <td style="padding:8px 12px;font-size:11px;color:var(--muted);"><code>${{c.room||''}}</code></td>
-      <td style="padding:8px 12px;font-size:11px;color:var(--muted);">${{c.timestamp?.substring(11,19)||''}}</td>
-    </tr>`).join('')}}</tbody>
-  </table>`;
-}}
-
-// ── SIP Trunks ────────────────────────────────────────────────────────────────
-async function loadSipTrunks() {{
-  const el = document.getElementById('sip-trunks-list'); if (!el) return;
-  el.innerHTML = '<div style="color:var(--muted);padding:20px;">Loading...</div>';
-  const data = await fetch('/api/sip-trunks').then(r=>r.json()).catch(()=>({{trunks:[]}}));
-  const trunks = data.trunks || [];
-  if (!trunks.length) {{
-    el.innerHTML = '<div class="section-card" style="color:var(--muted)">No SIP trunks yet. Click "+ Add SIP Trunk" to configure one.</div>';
-    return;
-  }}
-  el.innerHTML = trunks.map(t => `
-    <div class="section-card">
-      <div style="display:flex;justify-content:space-between;align-items:center;">
-        <div>
-          <div style="font-weight:700;font-size:15px;">🔌 ${{t.name}}</div>
-          <div style="font-size:12px;color:var(--muted);margin-top:4px;">Provider: ${{t.provider}} · Caller ID: ${{t.caller_id_number || 'N/A'}}</div>
-          <div style="font-size:12px;color:var(--muted);">SIP URI: ${{t.sip_uri}}</div>
-        </div>
-        <button class="btn btn-ghost" onclick="deleteSipTrunk(${{t.id}})" style="color:#f87171;">🗑 Remove</button>
-      </div>
-    </div>
-  `).join('');
-}}
-
-async function deleteSipTrunk(id) {{
-  if (!confirm('Remove this SIP trunk?')) return;
-  await fetch('/api/sip-trunks/'+id, {{method:'DELETE'}});
-  loadSipTrunks();
-}}
-
-function openSipTrunkModal() {{
-  ['sip-name','sip-provider','sip-uri','sip-callerid','sip-username','sip-password'].forEach(id => {{
-    document.getElementById(id).value = '';
-  }});
-  document.getElementById('sip-modal-error').style.display = 'none';
-  document.getElementById('sip-modal-overlay').style.display = 'flex';
-}}
-function closeSipTrunkModal(e) {{
-  if (e && e.target !== document.getElementById('sip-modal-overlay')) return;
-  document.getElementById('sip-modal-overlay').style.display = 'none';
-}}
-async function submitSipTrunk() {{
-  const name = document.getElementById('sip-name').value.trim();
-  const provider = document.getElementById('sip-provider').value.trim();
-  const sip_uri = document.getElementById('sip-uri').value.trim();
-  const caller_id_number = document.getElementById('sip-callerid').value.trim();
-  const username = document.getElementById('sip-username').value.trim();
-  const password = document.getElementById('sip-password').value.trim();
-  const errEl = document.getElementById('sip-modal-error');
-  if (!name || !provider || !sip_uri) {{ errEl.textContent = 'Name, Provider, and SIP URI are required.'; errEl.style.display='block'; return; }}
-  errEl.style.display = 'none';
-  try {{
-    const r = await fetch('/api/sip-trunks', {{
-      method:'POST', headers:{{'Content-Type':'application/json'}},
-      body:JSON.stringify({{name, provider, sip_uri, caller_id_number, username, password}})
-    }});
-    if (!r.ok) throw new Error('Server error ' + r.status);
-    document.getElementById('sip-modal-overlay').style.display = 'none';
-    loadSipTrunks();
-  }} catch(e) {{ errEl.textContent = '❌ Failed: ' + e.message; errEl.style.display='block'; }}
-}}
-
-// ── Demo Links ────────────────────────────────────────────────────────────────
-async function loadDemos() {{
-  const g=document.getElementById('demos-grid'); if(!g) return;
-  g.innerHTML='<div style="color:var(--muted);padding:20px;">Loading...</div>';
-  const demos=await fetch('/api/demo/list').then(r=>r.json()).catch(()=>[]);
-  if (!demos.length) {{ g.innerHTML='<div style="color:var(--muted);padding:20px;">No demo links yet. Create one to share with prospects!</div>'; return; }}
-  const LANG_NAMES = {{
-    'auto':'Auto-detect 🌐','hi-IN':'Hindi','en-IN':'English','ta-IN':'Tamil',
-    'te-IN':'Telugu','bn-IN':'Bengali','gu-IN':'Gujarati','kn-IN':'Kannada',
-    'ml-IN':'Malayalam','mr-IN':'Marathi','pa-IN':'Punjabi','od-IN':'Odia','ur-IN':'Urdu'
-  }};
-  g.innerHTML=demos.map(d=>`
-    <div class="demo-card">
-      <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:6px;">
-        <div style="font-weight:700;font-size:15px;">🎙️ ${{d.label||d.name||'Demo Link'}}</div>
-        <span style="font-size:11px;background:rgba(108,99,255,0.15);color:#a78bfa;padding:2px 8px;border-radius:20px;">
-          ${{LANG_NAMES[d.language||'auto']||d.language||'Auto'}}
-        </span>
-      </div>
-      <div style="font-size:11px;color:var(--muted);margin-bottom:8px;">
-        🔗 /demo/${{d.slug||d.token}} &nbsp;·&nbsp; 📞 ${{d.total_sessions||0}} sessions &nbsp;·&nbsp;
-        <span style="color:${{d.is_active?'#22c55e':'#ef4444'}}">●${{d.is_active?' Active':' Inactive'}}</span>
-      </div>
-      <div style="display:flex;gap:8px;flex-wrap:wrap;">
-        <button class="btn btn-primary btn-sm" onclick="copyDemo('${{d.slug||d.token}}')">📋 Copy Link</button>
-        <a class="btn btn-ghost btn-sm" href="/demo/${{d.slug||d.token}}" target="_blank" style="text-decoration:none;">👁 Preview</a>
-        <button class="btn btn-ghost btn-sm" style="color:var(--red)" onclick="deleteDemo('${{d.slug||d.token}}')">🗑 Deactivate</button>
-      </div>
-    </div>`).join('');
-}}
-
-function copyDemo(token) {{
-  const url=location.protocol+'//'+location.host+'/demo/'+token;
-  navigator.clipboard.writeText(url).then(()=>alert('✅ Copied: '+url));
-}}
-
-async function deleteDemo(token) {{
-  if (!confirm('Delete this demo link?')) return;
-  await fetch('/api/demo/'+token,{{method:'DELETE'}}); loadDemos();
-}}
-
-function openDemoModal() {{ document.getElementById('demo-modal').classList.add('open'); }}
-function closeDemoModal() {{ document.getElementById('demo-modal').classList.remove('open'); }}
-
-async function createDemo() {{
-  const g=id=>{{ const e=document.getElementById(id); return e?e.value:''; }};
-  await fetch('/api/demo/create',{{method:'POST',headers:{{'Content-Type':'application/json'}},
-    body:JSON.stringify({{label:g('dm-name'),language:g('dm-language')}})}});
-  closeDemoModal(); loadDemos();
-}}
-
-// ── Sidebar Active Agent Sync ───────────────────────────────────────────────
-async function syncSidebarName() {{
-  try {{
-    const res = await fetch('/api/active-agent');
-    if (!res.ok) return;
-    const a = await res.json();
-    if (a.error) return;
-    const nameEl = document.getElementById('sidebar-brand-name') || document.querySelector('.brand-text');
-    const subEl  = document.querySelector('.brand-sub');
-    if (a.name && nameEl) nameEl.textContent = a.name;
-    if (subEl) subEl.textContent = a.subtitle || 'AI Assistant';
-    console.log('[INIT] Active agent:', a.name);
-  }} catch(e) {{ console.warn('[INIT] syncSidebarName failed:', e); }}
-}}
-
-// ── Boot ─────────────────────────────────────────────────────────────────────
-document.addEventListener('DOMContentLoaded', () => {{
-  console.log('[INIT] Dashboard loading...');
-  loadDashboard();
-  initLiveCallsWS();
-  syncSidebarName();
-  setInterval(syncSidebarName, 5000);
-  console.log('[INIT] Dashboard ready');
-}});
-</script>
-</body>
-</html>"""
-
-    return HTMLResponse(content=html)
+    # Everything per-request goes into one JSON blob the page hydrates from; the rest
+    # of the HTML is static. "<" is escaped so a value can never close the <script>.
+    bootstrap = json.dumps({
+        "sidebar-brand-name": (active or {}).get("name", "Voice Agent"),
+        "sidebar-subtitle":   (active or {}).get("subtitle", "AI Assistant"),
+        **{key: config.get(key, "") for key in _DASHBOARD_CONFIG_FIELDS},
+        **{key: config.get(key, "") for key in _SELECT_OPTIONS},
+    }, sort_keys=True, default=str).replace("<", "\\u003c")
+
+    # The page is a pure function of the bootstrap: answer 304 when it is unchanged
+    digest = hashlib.blake2b(bootstrap.encode("utf-8"), digest_size=8, key=_DASHBOARD_TPL_HASH.encode()).hexdigest()
+    etag = f'W/"{digest}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, must-revalidate", "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=cache_headers)
+
+    accepted = _accepted_encodings(request)
+    encoding = "br" if brotli and "br" in accepted else "gzip" if "gzip" in accepted else "identity"
+    if encoding == "identity":
+        return HTMLResponse(content=_dashboard_body(bootstrap, encoding), headers=cache_headers)
+    # Brotli at this quality is a few ms of CPU on a cache miss; keep it off the event loop
+    body = await asyncio.to_thread(_dashboard_body, bootstrap, encoding)
+    return Response(content=body, media_type="text/html; charset=utf-8",
+                    headers={**cache_headers, "Content-Encoding": encoding})
 
 
 if __name__ == "__main__":